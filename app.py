@@ -1,43 +1,214 @@
+import time
+
 import customtkinter as ctk
-from PIL import Image
+
+from assets import AssetCache
+from backend import BackendClient
+from credentials import CredentialService
+from flow import (DASHBOARD, ENROLL_INFO, ENROLL_OTP, ENROLL_SUMMARY, ENROLL_VOICE, ENROLLMENT_FIELDS, ERROR,
+                  INFO, LOGIN, WELCOME, AuthFlow)
+from instrumentation import Instrumentation
+from startup import Prewarmer, StartupReport
+from state import StateStore
+from styles import (BG_COLOR, BUTTON_TEXT_COLOR, CARD_COLOR, ERROR_COLOR, FONT_TOKENS, HOVER_COLOR, LIGHT_PINK,
+                    LINK_COLOR, MUTED_COLOR, PINK, SUBTEXT_COLOR, TEXT_COLOR, Styles)
+from token_monitor import TokenMonitor
+from views import ViewManager
+from virtual_list import VirtualList
 
 # ========== APP SETTINGS ==========
-ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("dark-blue")
 
-PINK = "#e75480"
-LIGHT_PINK = "#f28ca0"
-BG_COLOR = "#1a1a1a"
-CARD_COLOR = "#2b2b2b"
-TEXT_COLOR = "white"
-SUBTEXT_COLOR = "gray80"
+APP_VERSION = "1.0.0"
+RECORDER_POLL_MS = 50
+VOICEPRINT_POLL_MS = 100
+HELP_ROW_HEIGHT = 120
+HISTORY_ROW_HEIGHT = 32
+
+# Icons decoded in idle time after the welcome page, so the dashboard never waits on PIL
+PREWARM_ICONS = [("logo.png", (75, 75)), ("logo.png", (80, 80)), ("help.png", (24, 24)), ("about.png", (24, 24)),
+                 ("usb.png", (48, 48)), ("key.png", (50, 50)), ("mic.png", (50, 50)), ("otp.png", (50, 50))]
+# Dashboard pages built in the background after it is first shown, most likely first
+PREWARM_VIEWS = ("apps", "profile")
+
+def mask_email(email):
+    # "alice@gmail.com" -> "a***@gmail.com"
+    if not email or "@" not in email:
+        return email or "-"
+    name, domain = email.split("@", 1)
+    return f"{name[:1]}***@{domain}"
+
+
+# Page rendered for each flow state
+FLOW_PAGES = {
+    WELCOME: "show_welcome_page",
+    LOGIN: "show_login_page",
+    ENROLL_INFO: "show_enrollment_step1",
+    ENROLL_VOICE: "show_enrollment_step2",
+    ENROLL_OTP: "show_enrollment_step3",
+    ENROLL_SUMMARY: "show_enrollment_summary",
+}
 
 
 class KeyVoxApp(ctk.CTk):
-    def __init__(self):
+    def __init__(self, theme="dark"):
         super().__init__()
         self.title("KeyVox")
         self.geometry("1000x600")
         self.resizable(False, False)
         self.configure(fg_color=BG_COLOR)
+        self.startup = StartupReport.from_env(APP_VERSION)
+        self.startup.mark("imports")
+        self.styles = Styles(theme=theme)
         self.current_frame = None
-        self.enrollment_data = {}
+        self.show_splash()
+
+        self.services_loaded = False
+        self.enrollment_voiceprint = None
+        self.voiceprint_future = None
+        self.enrollment_complete = False
+        self.assets = AssetCache(scale=ctk.ScalingTracker.get_window_scaling(self))
+        self.backend = BackendClient.from_env(self)
+        self.credentials = CredentialService(self)
+        self.flow = AuthFlow(remote=self.backend is not None)
+        self.flow.subscribe(self.on_flow_event)
+        self.form_message = None
+        self.history_list = None
+        self.token_monitor = TokenMonitor()
+        try:
+            self.token_monitor.start().attach(self, self.on_token_changed)
+        except Exception as e:
+            # The token card is optional; it must never keep the window from opening
+            print(f"Token monitor unavailable: {e}")
+        # Everything the dashboard displays; pages bind labels to keys instead of baking in text
+        self.app_state = StateStore(self, **self.token_monitor.state)
+        self.app_state.start_clock()
+        self.bind("<Control-t>", lambda event: self.toggle_theme())
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.instrumentation = Instrumentation.from_env()
+        if self.instrumentation:
+            self.instrumentation.install(self)
         self.show_welcome_page()
 
+        # The welcome page needs none of the audio/voiceprint stack; it and the assets
+        # for the next pages load one chunk per idle pass once the page is up
+        self.after_idle(self.startup.mark, "interactive")
+        self.prewarmer = Prewarmer(self, self.startup, on_drained=self.on_prewarmed)
+        self.prewarmer.add([
+            ("services", self.load_services),
+            ("fonts", lambda: [self.styles.font(token) for token in FONT_TOKENS]),
+            ("icons", lambda: self.assets.preload(PREWARM_ICONS)),
+        ])
+
+    # =========================================================
+    # STARTUP
+    # =========================================================
+    def show_splash(self):
+        # Text only, so the first frame needs no image decode; painted before anything heavy
+        splash = ctk.CTkFrame(self, fg_color=BG_COLOR)
+        splash.pack(fill="both", expand=True)
+        self.current_frame = splash
+        ctk.CTkLabel(splash, text="KeyVox", font=self.styles.font("brand"),
+                     text_color=PINK).place(relx=0.5, rely=0.45, anchor="center")
+        ctk.CTkLabel(splash, text="Starting…", font=self.styles.font("caption"),
+                     text_color=MUTED_COLOR).place(relx=0.5, rely=0.55, anchor="center")
+        self.update()
+        self.startup.mark("first_frame")
+
+    def load_services(self):
+        # NumPy and everything built on it; also called directly by the first page that
+        # needs it in case the user gets there before the prewarm chunk has run
+        if self.services_loaded:
+            return
+        from audio import PhraseRecorder
+        from store import EnrollmentStore
+        from verifier import VoiceVerifier
+        from voice_index import VoiceIndex
+        from voiceprint import VoiceprintExtractor
+
+        self.recorder = PhraseRecorder()
+        self.verifier = VoiceVerifier()
+        self.extractor = VoiceprintExtractor()
+        self.store = EnrollmentStore.open()
+        self.voice_index = VoiceIndex(approximate=True)
+        self.voice_index.load(*self.store.voiceprints())
+        self.services_loaded = True
+
+    def on_prewarmed(self):
+        # The queue also drains after each dashboard prewarm; startup is reported once
+        if "prewarmed" in self.startup.marks:
+            return
+        self.startup.mark("prewarmed")
+        self.startup.export()
+        if self.instrumentation:
+            for name, ms in self.startup.marks.items():
+                self.instrumentation.observe(f"startup:{name}", ms)
+
     # =========================================================
     # PAGE HELPERS
     # =========================================================
     def clear_frame(self):
+        # Nothing keeps listening once its page is gone
+        if self.services_loaded:
+            self.verifier.stop()
+            self.recorder.stop()
+        if self.backend:
+            self.backend.cancel("page")
         if self.current_frame:
             self.current_frame.destroy()
 
-    def clear_content(self):
-        if hasattr(self, 'content_frame') and self.content_frame:
-            for widget in self.content_frame.winfo_children():
-                widget.destroy()
-            self.content_frame.pack_forget()
-            self.content_frame.grid_forget()
-            self.content_frame.pack(side="top", fill="both", expand=True, padx=20, pady=10)
+    def show_form_message(self, text, color=ERROR_COLOR):
+        # One reusable message label per page instead of stacking a new one per attempt
+        if self.form_message is None or not self.form_message.winfo_exists() \
+                or self.form_message.master is not self.current_frame:
+            self.form_message = ctk.CTkLabel(self.current_frame, text="", font=self.styles.font("caption"))
+            self.form_message.pack(pady=5)
+        self.form_message.configure(text=text, text_color=color)
+
+    def on_flow_event(self, event, flow):
+        if event == "message":
+            text, kind = flow.message
+            self.show_form_message(text, ERROR_COLOR if kind == ERROR else SUBTEXT_COLOR)
+            return
+        if flow.state == ENROLL_SUMMARY:
+            self.enrollment_complete = True
+            self.commit_enrollment()
+        if flow.state == WELCOME:
+            self.cancel_enrollment()
+        if flow.state == DASHBOARD:
+            self.store.log_access(flow.current_user, "Signed in", self.token_monitor.state["token_id"])
+            self.load_user_state(flow.current_user)
+            self.show_dashboard(flow.current_user)
+        else:
+            getattr(self, FLOW_PAGES[flow.state])()
+
+    def send(self, request, scope="page"):
+        # Executes a backend Request produced by the flow; results land on the Tk thread
+        if request is not None and self.backend is not None:
+            self.backend.request(request.method, request.path, request.body, scope=scope,
+                                 on_done=request.done, on_error=request.failed)
+
+    def toggle_theme(self):
+        self.styles.toggle_theme()
+
+    def on_close(self):
+        self.prewarmer.cancel()
+        if self.services_loaded:
+            self.recorder.stop()
+            self.verifier.stop()
+            self.extractor.shutdown()
+            self.store.close()
+        try:
+            self.token_monitor.stop()
+        except Exception as e:
+            print(f"Token monitor error: {e}")
+        self.app_state.stop()
+        self.credentials.shutdown()
+        if self.backend:
+            self.backend.close()
+        if self.instrumentation:
+            self.instrumentation.uninstall()
+        self.destroy()
 
     # =========================================================
     # WELCOME PAGE
@@ -49,93 +220,144 @@ class KeyVoxApp(ctk.CTk):
         self.current_frame = frame
 
         try:
-            logo_img = ctk.CTkImage(Image.open("logo.png"), size=(130, 130))
+            logo_img = self.assets.image("logo.png", (130, 130))
             ctk.CTkLabel(frame, image=logo_img, text="").pack(pady=(80, 15))
         except Exception:
-            ctk.CTkLabel(frame, text="🔑", font=("Segoe UI", 60)).pack(pady=(80, 15))
+            ctk.CTkLabel(frame, text="🔑", font=("Segoe UI", 60), text_color=TEXT_COLOR).pack(pady=(80, 15))
 
         ctk.CTkLabel(frame, text="Welcome to KeyVox",
-                     font=ctk.CTkFont(size=34, weight="bold"),
-                     text_color="white").pack(pady=(0, 10))
+                     font=self.styles.font("hero"),
+                     text_color=TEXT_COLOR).pack(pady=(0, 10))
 
         ctk.CTkLabel(frame,
                      text="Your voice, your key — secure and smart access control",
-                     font=ctk.CTkFont(size=16),
-                     text_color="gray80").pack(pady=(0, 30))
+                     font=self.styles.font("body_lg"),
+                     text_color=SUBTEXT_COLOR).pack(pady=(0, 30))
 
         ctk.CTkButton(frame, text="Get Started",
                       fg_color=PINK, hover_color=LIGHT_PINK,
-                      text_color="white", font=ctk.CTkFont(size=18, weight="bold"),
+                      text_color=BUTTON_TEXT_COLOR, font=self.styles.font("button_lg"),
                       corner_radius=25, width=200, height=45,
-                      command=self.show_login_page).pack(pady=(10, 40))
+                      command=self.flow.get_started).pack(pady=(10, 40))
 
         ctk.CTkLabel(frame, text="© 2025 KeyVox Technologies",
-                     text_color="gray60", font=ctk.CTkFont(size=12)
+                     text_color=MUTED_COLOR, font=self.styles.font("caption")
                      ).pack(side="bottom", pady=20)
 
     # =========================================================
     # LOGIN PAGE
     # =========================================================
     def show_login_page(self):
+        self.load_services()
         self.clear_frame()
         frame = ctk.CTkFrame(self, fg_color=BG_COLOR)
         frame.pack(fill="both", expand=True)
         self.current_frame = frame
 
         ctk.CTkButton(frame, text="← Back",
-                      fg_color="transparent", hover_color="#2e2e2e",
-                      text_color="gray80", width=100, height=35,
-                      command=self.show_welcome_page).place(x=20, y=20)
+                      fg_color="transparent", hover_color=HOVER_COLOR,
+                      text_color=SUBTEXT_COLOR, width=100, height=35,
+                      command=self.flow.back).place(x=20, y=20)
 
         ctk.CTkLabel(frame, text="Login to KeyVox",
-                     font=ctk.CTkFont(size=28, weight="bold"), text_color=PINK).pack(pady=(90, 20))
+                     font=self.styles.font("title"), text_color=PINK).pack(pady=(90, 20))
 
         username = ctk.CTkEntry(frame, placeholder_text="Username",
                                 width=300, height=40, corner_radius=15,
                                 fg_color=CARD_COLOR, border_color=PINK, border_width=2,
-                                text_color="white")
+                                text_color=TEXT_COLOR)
         username.pack(pady=10)
 
         password = ctk.CTkEntry(frame, placeholder_text="Password",
                                 show="•", width=300, height=40, corner_radius=15,
                                 fg_color=CARD_COLOR, border_color=PINK, border_width=2,
-                                text_color="white")
+                                text_color=TEXT_COLOR)
         password.pack(pady=10)
 
         ctk.CTkButton(frame, text="Login", fg_color=PINK, hover_color=LIGHT_PINK,
-                      text_color="white", corner_radius=25, width=200, height=40,
-                      font=ctk.CTkFont(size=16, weight="bold"),
-                      command=lambda: self.fake_login(username.get(), password.get())).pack(pady=25)
+                      text_color=BUTTON_TEXT_COLOR, corner_radius=25, width=200, height=40,
+                      font=self.styles.font("button"),
+                      command=lambda: self.fake_login(username.get(), password.get())).pack(pady=(25, 10))
+
+        # Voice unlock is only offered once a score model fitted for this setup is configured
+        if self.verifier.enabled:
+            self.voice_login_button = ctk.CTkButton(frame, text="Login with Voice", fg_color="transparent",
+                                                    hover_color=HOVER_COLOR, border_color=PINK, border_width=2,
+                                                    text_color=PINK, corner_radius=25, width=200, height=40,
+                                                    font=self.styles.font("button"),
+                                                    command=lambda: self.voice_login(username.get()))
+            self.voice_login_button.pack(pady=(0, 15))
 
         ctk.CTkButton(frame, text="No account? Enroll your voice",
-                      fg_color="transparent", hover_color="#2e2e2e",
-                      text_color=LIGHT_PINK, width=250, height=35,
-                      command=self.show_enrollment_step1).pack(pady=(5, 10))
+                      fg_color="transparent", hover_color=HOVER_COLOR,
+                      text_color=LINK_COLOR, width=250, height=35,
+                      command=self.flow.start_enrollment).pack(pady=(5, 10))
 
     def fake_login(self, username, password):
-        if username and password:
-            self.show_dashboard(username)
-        else:
-            ctk.CTkLabel(self.current_frame, text="Please enter both username and password.",
-                         text_color="red", font=ctk.CTkFont(size=12)).pack(pady=5)
+        # Locally enrolled users are checked against their stored hash on the worker pool
+        encoded = self.store.password_hash(username)
+        if self.backend is None and encoded is not None and password:
+            self.flow.notify_message("Checking password...", INFO)
+            self.credentials.verify(password, encoded,
+                                    on_done=lambda ok: self.on_password_checked(username, password, ok))
+            return
+        self.send(self.flow.login(username, password))
+
+    def on_password_checked(self, username, password, ok):
+        if self.flow.state != LOGIN:
+            return
+        if not ok:
+            self.flow.notify_message("Invalid username or password.")
+            return
+        if self.credentials.needs_rehash(self.store.password_hash(username)):
+            self.credentials.hash(password, on_done=lambda encoded: self.store.set_password_hash(username, encoded))
+        self.flow.login(username, password)
+
+    def voice_login(self, username):
+        # Streams the mic (or KEYVOX_WAV_INPUT) through the verifier, which stops listening
+        # as soon as it is confident either way; a second tap cancels
+        if self.verifier.busy:
+            self.verifier.stop()
+            return
+        voiceprint = self.voice_index.get(username)
+        if self.flow.voice_login(username, voiceprint is not None) and self.verifier.start(username, voiceprint):
+            self.voice_login_button.configure(text="Listening... (tap to stop)")
+            self.after(RECORDER_POLL_MS, self.poll_voice_login)
+
+    def poll_voice_login(self):
+        self.verifier.drain(self.on_voice_verified)
+        if self.verifier.pending:
+            self.after(RECORDER_POLL_MS, self.poll_voice_login)
+
+    def on_voice_verified(self, username, decision, seconds, error):
+        if self.flow.state != LOGIN:
+            return
+        self.voice_login_button.configure(text="Login with Voice")
+        if error is not None:
+            print(f"Voice login error: {error}")
+            self.flow.notify_message("Microphone unavailable. Use your password instead.")
+        elif decision is not None:
+            from verifier import ACCEPT
+            self.flow.voice_verified(username, decision == ACCEPT)
 
     # =========================================================
     # ENROLLMENT PAGES (STEP 1–3 + SUMMARY)
     # =========================================================
     def show_enrollment_step1(self):
+        self.load_services()
         self.clear_frame()
         frame = ctk.CTkFrame(self, fg_color=BG_COLOR)
         frame.pack(fill="both", expand=True)
         self.current_frame = frame
 
         ctk.CTkLabel(frame, text="Enrollment - Step 1: User Information",
-                     text_color=PINK, font=ctk.CTkFont(size=24, weight="bold")).pack(pady=30)
+                     text_color=PINK, font=self.styles.font("section")).pack(pady=30)
 
         entries = {}
-        for field in ["Full Name", "Username", "Password", "Confirm Password", "Email Address"]:
+        for field in ENROLLMENT_FIELDS:
             entry = ctk.CTkEntry(frame, placeholder_text=field, width=300, height=40,
                                  corner_radius=15, fg_color=CARD_COLOR, border_color=PINK, border_width=2,
-                                 text_color="white", show="•" if "Password" in field else "")
+                                 text_color=TEXT_COLOR, show="•" if "Password" in field else "")
             entry.pack(pady=8)
             entries[field] = entry
 
@@ -144,35 +366,147 @@ class KeyVoxApp(ctk.CTk):
                       command=lambda: self.store_enrollment_data(entries)).pack(pady=25)
 
         ctk.CTkButton(frame, text="← Back", fg_color="transparent",
-                      text_color="gray80", hover_color="#2e2e2e",
-                      command=self.show_login_page).pack(pady=5)
+                      text_color=SUBTEXT_COLOR, hover_color=HOVER_COLOR,
+                      command=self.flow.back).pack(pady=5)
 
     def store_enrollment_data(self, entries):
-        self.enrollment_data = {field: entry.get() for field, entry in entries.items()}
-        self.show_enrollment_step2()
+        data = {field: entry.get() for field, entry in entries.items()}
+        if self.flow.submit_enrollment_info(data):
+            # Hashing is calibrated to take a noticeable fraction of a second, so it runs
+            # on the credential pool while the user records their phrases
+            submitted = self.flow.enrollment_data
+            self.credentials.hash(data["Password"], on_done=lambda encoded: self.on_password_hashed(submitted, encoded))
+
+    def on_password_hashed(self, submitted, encoded):
+        # Ignore hashes of a password that has since been resubmitted
+        if submitted is self.flow.enrollment_data:
+            self.flow.password_hashed(encoded)
+            self.commit_enrollment()
 
     def show_enrollment_step2(self):
+        self.load_services()
         self.clear_frame()
         frame = ctk.CTkFrame(self, fg_color=BG_COLOR)
         frame.pack(fill="both", expand=True)
         self.current_frame = frame
 
         ctk.CTkLabel(frame, text="Enrollment - Step 2: Voice Enrollment",
-                     text_color=PINK, font=ctk.CTkFont(size=24, weight="bold")).pack(pady=30)
+                     text_color=PINK, font=self.styles.font("section")).pack(pady=(20, 8))
+
+        # Live waveform of the phrase being recorded, fed from the recorder's ring buffer
+        from meter import LevelMeter
+        self.level_meter = LevelMeter(frame, lambda: self.recorder.buffer, self.recorder.sample_rate,
+                                      width=480, height=60)
+        self.level_meter.pack(pady=(0, 8))
 
+        self.record_buttons = {}
         for i in range(1, 6):
             ctk.CTkLabel(frame, text=f"Voice Phrase {i}: \"This is my secure voice.\"",
-                         text_color="white", font=ctk.CTkFont(size=16)).pack(pady=5)
-            ctk.CTkButton(frame, text=f"Record Phrase {i}", fg_color=PINK, hover_color=LIGHT_PINK,
-                          width=200, height=35, corner_radius=25).pack(pady=5)
+                         text_color=TEXT_COLOR, font=self.styles.font("body_lg")).pack(pady=(4, 0))
+            label = f"Re-record Phrase {i} ✓" if i in self.flow.enrollment_phrases else f"Record Phrase {i}"
+            button = ctk.CTkButton(frame, text=label, fg_color=PINK, hover_color=LIGHT_PINK,
+                                   width=200, height=35, corner_radius=25,
+                                   command=lambda i=i: self.record_phrase(i))
+            button.pack(pady=(2, 4))
+            self.record_buttons[i] = button
 
         ctk.CTkButton(frame, text="Next", fg_color=PINK, hover_color=LIGHT_PINK,
                       width=200, height=40, corner_radius=25,
-                      command=self.show_enrollment_step3).pack(pady=25)
+                      command=self.finish_voice_enrollment).pack(pady=15)
 
         ctk.CTkButton(frame, text="← Back", fg_color="transparent",
-                      text_color="gray80", hover_color="#2e2e2e",
-                      command=self.show_enrollment_step1).pack(pady=5)
+                      text_color=SUBTEXT_COLOR, hover_color=HOVER_COLOR,
+                      command=self.flow.back).pack(pady=5)
+
+    def record_phrase(self, index):
+        # A second tap while recording ends the current phrase early
+        if self.recorder.busy:
+            self.recorder.stop()
+            return
+        # Tagged with this enrollment so a phrase finishing after Back/Next is dropped
+        if self.recorder.start((self.flow.enrollment_data, index)):
+            self.record_buttons[index].configure(text="Recording... (tap to stop)")
+            self.level_meter.start()
+            self.after(RECORDER_POLL_MS, self.poll_recorder)
+
+    def poll_recorder(self):
+        self.recorder.drain(self.on_phrase_recorded)
+        if self.recorder.pending:
+            self.after(RECORDER_POLL_MS, self.poll_recorder)
+        elif self.level_meter.winfo_exists():
+            self.level_meter.stop()
+
+    def on_phrase_recorded(self, tag, samples, sample_rate, error):
+        enrollment, index = tag
+        if enrollment is not self.flow.enrollment_data or self.flow.state != ENROLL_VOICE:
+            return
+        if error is None and len(samples):
+            self.flow.phrase_recorded(index, samples, sample_rate)
+            text = f"Re-record Phrase {index} ✓"
+        elif error is None:
+            text = f"No voice heard - Record Phrase {index}"
+        else:
+            print(f"Recording error: {error}")
+            text = f"Mic error - Record Phrase {index}"
+
+        button = self.record_buttons.get(index)
+        if button is not None and button.winfo_exists():
+            button.configure(text=text)
+
+    def finish_voice_enrollment(self):
+        # All recorded phrases go to the extractor as one batch while the user does step 3
+        if self.recorder.busy:
+            self.flow.notify_message("Finish recording the current phrase first.")
+            return
+        recorded = self.flow.enrollment_phrases
+        self.enrollment_voiceprint = None
+        self.enrollment_complete = False
+        self.voiceprint_future = None
+        if recorded:
+            phrases = [samples for samples, _ in recorded.values()]
+            sample_rate = next(iter(recorded.values()))[1]
+            self.voiceprint_future = self.extractor.submit(phrases, sample_rate)
+            self.after(VOICEPRINT_POLL_MS, self.poll_voiceprint)
+        self.flow.finish_voice_enrollment()
+
+    def poll_voiceprint(self):
+        future = self.voiceprint_future
+        if future is None or future.cancelled():
+            return
+        if not future.done():
+            self.after(VOICEPRINT_POLL_MS, self.poll_voiceprint)
+            return
+        self.voiceprint_future = None
+        try:
+            self.enrollment_voiceprint = future.result()
+        except Exception as e:
+            print(f"Voiceprint error: {e}")
+        self.commit_enrollment()
+
+    def commit_enrollment(self):
+        # Runs at the summary and again when the voiceprint or password hash lands; the
+        # finished enrollment is written in one store commit once both are in
+        if not self.enrollment_complete or self.voiceprint_future is not None or self.flow.password_hash is None:
+            return
+        self.enrollment_complete = False
+        data = self.flow.enrollment_data
+        username = data.get("Username", "")
+        self.store.save(username, data.get("Full Name", ""), data.get("Email Address", ""),
+                        self.flow.password_hash, self.enrollment_voiceprint)
+        self.store.commit()
+        if self.enrollment_voiceprint is not None:
+            self.voice_index.add(username, self.enrollment_voiceprint)
+        self.send(self.flow.enrollment_request(), scope=None)
+        # The user may already be on the dashboard, which read the profile before it existed
+        if self.flow.current_user == username:
+            self.load_user_state(username)
+
+    def cancel_enrollment(self):
+        # Logout or deactivation: a voiceprint or hash landing later must not write the user back
+        self.enrollment_complete = False
+        if self.voiceprint_future is not None:
+            self.voiceprint_future.cancel()
+            self.voiceprint_future = None
 
     def show_enrollment_step3(self):
         self.clear_frame()
@@ -181,24 +515,31 @@ class KeyVoxApp(ctk.CTk):
         self.current_frame = frame
 
         ctk.CTkLabel(frame, text="Enrollment - Step 3: OTP Verification",
-                     text_color=PINK, font=ctk.CTkFont(size=24, weight="bold")).pack(pady=30)
+                     text_color=PINK, font=self.styles.font("section")).pack(pady=30)
 
         ctk.CTkLabel(frame, text="Enter the 6-digit code sent to your email address:",
-                     text_color="white", font=ctk.CTkFont(size=16)).pack(pady=10)
+                     text_color=TEXT_COLOR, font=self.styles.font("body_lg")).pack(pady=10)
         otp = ctk.CTkEntry(frame, width=150, height=40, corner_radius=15,
                            fg_color=CARD_COLOR, border_color=PINK, border_width=2,
-                           text_color="white")
+                           text_color=TEXT_COLOR)
         otp.pack(pady=10)
 
         ctk.CTkButton(frame, text="Send Code", fg_color=PINK, hover_color=LIGHT_PINK,
-                      width=150, height=35, corner_radius=25).pack(pady=5)
+                      width=150, height=35, corner_radius=25,
+                      command=self.send_otp).pack(pady=5)
         ctk.CTkButton(frame, text="Verify", fg_color=PINK, hover_color=LIGHT_PINK,
                       width=150, height=35, corner_radius=25,
-                      command=self.show_enrollment_summary).pack(pady=20)
+                      command=lambda: self.verify_otp(otp.get())).pack(pady=20)
 
         ctk.CTkButton(frame, text="← Back", fg_color="transparent",
-                      text_color="gray80", hover_color="#2e2e2e",
-                      command=self.show_enrollment_step2).pack(pady=5)
+                      text_color=SUBTEXT_COLOR, hover_color=HOVER_COLOR,
+                      command=self.flow.back).pack(pady=5)
+
+    def send_otp(self):
+        self.send(self.flow.send_code())
+
+    def verify_otp(self, code):
+        self.send(self.flow.verify_code(code))
 
     def show_enrollment_summary(self):
         self.clear_frame()
@@ -207,23 +548,33 @@ class KeyVoxApp(ctk.CTk):
         self.current_frame = frame
 
         ctk.CTkLabel(frame, text="Enrollment Complete!",
-                     text_color=PINK, font=ctk.CTkFont(size=26, weight="bold")).pack(pady=30)
+                     text_color=PINK, font=self.styles.font("heading")).pack(pady=30)
 
-        for k, v in self.enrollment_data.items():
-            ctk.CTkLabel(frame, text=f"{k}: {v}", text_color="white",
-                         font=ctk.CTkFont(size=14)).pack(pady=2)
+        for k, v in self.flow.enrollment_data.items():
+            ctk.CTkLabel(frame, text=f"{k}: {v}", text_color=TEXT_COLOR,
+                         font=self.styles.font("body")).pack(pady=2)
 
         ctk.CTkButton(frame, text="Proceed to Dashboard", fg_color=PINK,
                       hover_color=LIGHT_PINK, corner_radius=25,
                       width=250, height=40,
-                      command=lambda: self.show_dashboard(self.enrollment_data.get("Username", "User"))).pack(pady=30)
+                      command=self.flow.proceed_to_dashboard).pack(pady=30)
 
     # =========================================================
     # DASHBOARD + NAVIGATION (NAVBAR VERSION)
     # =========================================================
+    def load_user_state(self, username):
+        profile = self.store.profile(username) or {}
+        self.app_state.update({
+            "username": username,
+            "full_name": profile.get("full_name"),
+            "email": profile.get("email"),
+            "enrolled_at": profile.get("enrolled_at"),
+            "voice_enrolled": username in self.voice_index,
+        })
+
     def show_dashboard(self, username):
+        self.load_services()
         self.clear_frame()
-        self.current_user = username
         dashboard = ctk.CTkFrame(self, fg_color=BG_COLOR)
         dashboard.pack(fill="both", expand=True)
         self.current_frame = dashboard
@@ -232,72 +583,84 @@ class KeyVoxApp(ctk.CTk):
         navbar.pack(side="top", fill="x")
 
         try:
-            logo = ctk.CTkImage(Image.open("logo.png"), size=(75, 75))
+            logo = self.assets.image("logo.png", (75, 75))
             logo_label = ctk.CTkLabel(navbar, image=logo, text="")
             logo_label.pack(side="left", padx=(30, 20), pady=7)
         except:
-            logo_label = ctk.CTkLabel(navbar, text="KeyVox", font=ctk.CTkFont(size=36, weight="bold"))
+            logo_label = ctk.CTkLabel(navbar, text="KeyVox", font=self.styles.font("brand"),
+                                      text_color=TEXT_COLOR)
             logo_label.pack(side="left", padx=30, pady=15)
         
         nav_frame = ctk.CTkFrame(navbar, fg_color="transparent")
         nav_frame.pack(side="left", padx=20)
 
-        nav_font = ctk.CTkFont(size=16)
+        nav_font = self.styles.font("nav")
         self.home_btn = ctk.CTkButton(nav_frame, text="Home", fg_color=PINK,
-                                      hover_color=LIGHT_PINK, text_color="white", font=nav_font,
+                                      hover_color=LIGHT_PINK, text_color=BUTTON_TEXT_COLOR, font=nav_font,
                                       command=self.navigate_to_home)
         self.home_btn.pack(side="left", padx=10)
 
         self.apps_btn = ctk.CTkButton(nav_frame, text="Applications", fg_color="transparent",
-                                      hover_color=LIGHT_PINK, text_color="white", font=nav_font,
+                                      hover_color=LIGHT_PINK, text_color=TEXT_COLOR, font=nav_font,
                                       command=self.navigate_to_apps)
         self.apps_btn.pack(side="left", padx=10)
 
         self.profile_btn = ctk.CTkButton(nav_frame, text="User Profile", fg_color="transparent",
-                                        hover_color=LIGHT_PINK, text_color="white", font=nav_font,
+                                        hover_color=LIGHT_PINK, text_color=TEXT_COLOR, font=nav_font,
                                         command=self.navigate_to_profile)
         self.profile_btn.pack(side="left", padx=10)
 
         status_frame = ctk.CTkFrame(navbar, fg_color="transparent")
         status_frame.pack(side="right", padx=30)
         
-        ctk.CTkLabel(status_frame, text="status", text_color="gray80").pack(side="left", padx=10)
+        ctk.CTkLabel(status_frame, text="status", text_color=SUBTEXT_COLOR).pack(side="left", padx=10)
+        ctk.CTkButton(status_frame, text="◐", font=self.styles.font("button"),
+                      fg_color="transparent", text_color=TEXT_COLOR, width=24, height=24,
+                      hover_color=HOVER_COLOR, command=self.toggle_theme).pack(side="left", padx=5)
         try:
-            help_icon = ctk.CTkImage(Image.open("help.png"), size=(24, 24))
+            help_icon = self.assets.image("help.png", (24, 24))
             help_button = ctk.CTkButton(status_frame, image=help_icon, text="", fg_color="transparent",
-                                        width=24, height=24, hover_color="#2e2e2e",
+                                        width=24, height=24, hover_color=HOVER_COLOR,
                                         command=self.show_help_page)
             help_button.pack(side="left", padx=5)
 
-            about_icon = ctk.CTkImage(Image.open("about.png"), size=(24, 24))
+            about_icon = self.assets.image("about.png", (24, 24))
             about_button = ctk.CTkButton(status_frame, image=about_icon, text="", fg_color="transparent",
-                                         width=24, height=24, hover_color="#2e2e2e",
+                                         width=24, height=24, hover_color=HOVER_COLOR,
                                          command=self.show_about_page)
             about_button.pack(side="left", padx=5)
         except Exception as e:
             print(f"Icon error: {e}. Using text buttons as fallback.")
-            help_fallback = ctk.CTkButton(status_frame, text="?", font=ctk.CTkFont(size=16, weight="bold"),
+            help_fallback = ctk.CTkButton(status_frame, text="?", font=self.styles.font("button"),
                                           fg_color="transparent", width=24, height=24,
-                                          hover_color="#2e2e2e", command=self.show_help_page)
+                                          hover_color=HOVER_COLOR, command=self.show_help_page)
             help_fallback.pack(side="left", padx=5)
             
-            about_fallback = ctk.CTkButton(status_frame, text="i", font=ctk.CTkFont(size=16, weight="bold"),
+            about_fallback = ctk.CTkButton(status_frame, text="i", font=self.styles.font("button"),
                                            fg_color="transparent", width=24, height=24,
-                                           hover_color="#2e2e2e", command=self.show_about_page)
+                                           hover_color=HOVER_COLOR, command=self.show_about_page)
             about_fallback.pack(side="left", padx=5)
 
 
         self.content_frame = ctk.CTkFrame(dashboard, fg_color=BG_COLOR)
         self.content_frame.pack(side="top", fill="both", expand=True, padx=20, pady=10)
-        
+
+        self.views = ViewManager(self.content_frame, fg_color=BG_COLOR)
+        self.views.register("home", self.build_home)
+        self.views.register("apps", self.build_applications)
+        self.views.register("profile", self.build_user_profile)
+        self.views.register("about", self.build_about_page)
+        self.views.register("help", self.build_help_page)
+
         self.navigate_to_home()
+        self.prewarmer.add([(f"view:{name}", lambda name=name: self.views.prewarm(name)) for name in PREWARM_VIEWS])
 
     def update_nav_style(self, active_button):
         for btn in [self.home_btn, self.apps_btn, self.profile_btn]:
             if btn == active_button:
-                btn.configure(fg_color=PINK)
+                btn.configure(fg_color=PINK, text_color=BUTTON_TEXT_COLOR)
             else:
-                btn.configure(fg_color="transparent")
+                btn.configure(fg_color="transparent", text_color=TEXT_COLOR)
 
     # --- Navigation wrapper methods ---
     def navigate_to_home(self):
@@ -316,46 +679,117 @@ class KeyVoxApp(ctk.CTk):
     # HOME PAGE
     # =========================================================
     def show_home(self):
-        self.clear_content()
-        card = ctk.CTkFrame(self.content_frame, fg_color=CARD_COLOR, corner_radius=25)
-        card.pack(pady=80, ipadx=60, ipady=30)
+        self.views.show("home")
 
-        ctk.CTkLabel(card, text="Security Token Detected",
-                     text_color=TEXT_COLOR, font=ctk.CTkFont(size=24, weight="bold")).pack(pady=(30, 20))
+    def build_home(self, parent):
+        card = ctk.CTkFrame(parent, fg_color=CARD_COLOR, corner_radius=25)
+        card.pack(side="left", padx=(40, 20), pady=40, ipadx=30, ipady=10)
 
-        ctk.CTkLabel(card, text="Token ID: f3d4-9a7b-23ce-8e6f",
-                     text_color=SUBTEXT_COLOR, font=ctk.CTkFont(size=14)).pack(pady=5)
+        try:
+            usb_icon = self.assets.image("usb.png", (48, 48))
+            ctk.CTkLabel(card, image=usb_icon, text="").pack(pady=(30, 0))
+        except Exception:
+            pass
 
-        ctk.CTkLabel(card, text="Last Sync: 5 seconds ago",
-                     text_color=SUBTEXT_COLOR, font=ctk.CTkFont(size=14)).pack(pady=5)
+        # Token changes and the clock tick reconfigure only the label whose text changed
+        bind = self.app_state.bind
+        bind("present", ctk.CTkLabel(card, text_color=TEXT_COLOR, font=self.styles.font("section")),
+             format=lambda present: "Security Token Detected" if present else "No Security Token"
+             ).pack(pady=(10, 20))
+        bind("token_id", ctk.CTkLabel(card, text_color=SUBTEXT_COLOR, font=self.styles.font("body")),
+             format=lambda token_id: f"Token ID: {token_id or '—'}").pack(pady=5)
+        bind(("last_sync", "now"), ctk.CTkLabel(card, text_color=SUBTEXT_COLOR, font=self.styles.font("body")),
+             format=self.format_last_sync).pack(pady=5)
 
         ctk.CTkButton(card, text="Manage Applications",
-                      fg_color=PINK, hover_color=LIGHT_PINK, text_color="white",
+                      fg_color=PINK, hover_color=LIGHT_PINK, text_color=BUTTON_TEXT_COLOR,
                       corner_radius=25, width=250, height=45,
-                      font=ctk.CTkFont(size=16, weight="bold")).pack(pady=(40, 20))
-        
+                      font=self.styles.font("button")).pack(pady=(40, 20))
+
+        # Access history can run to thousands of rows per token, so only visible rows exist
+        history = ctk.CTkFrame(parent, fg_color=CARD_COLOR, corner_radius=25)
+        history.pack(side="left", fill="both", expand=True, padx=(20, 40), pady=40)
+        ctk.CTkLabel(history, text="Access History", text_color=TEXT_COLOR,
+                     font=self.styles.font("card_title")).pack(anchor="w", padx=20, pady=(20, 10))
+        self.history_list = VirtualList(history, HISTORY_ROW_HEIGHT, self.make_history_row,
+                                        self.bind_history_row, fg_color=CARD_COLOR)
+        self.history_list.pack(fill="both", expand=True, padx=10, pady=(0, 20))
+        self.refresh_history()
+
+    def refresh_history(self):
+        user = self.flow.current_user
+        self.history_list.reset(count=self.store.access_count(user),
+                                fetch=lambda offset, limit: self.store.access_page(user, offset, limit))
+
+    def make_history_row(self, container):
+        row = {
+            "when": ctk.CTkLabel(container, text="", text_color=SUBTEXT_COLOR, font=self.styles.font("caption"),
+                                 width=130, anchor="w"),
+            "event": ctk.CTkLabel(container, text="", text_color=TEXT_COLOR, font=self.styles.font("body"),
+                                  anchor="w"),
+            "token": ctk.CTkLabel(container, text="", text_color=MUTED_COLOR, font=self.styles.font("caption"),
+                                  anchor="e"),
+        }
+        row["when"].pack(side="left", padx=(10, 5))
+        row["event"].pack(side="left", padx=5)
+        row["token"].pack(side="right", padx=10)
+        return row
+
+    def bind_history_row(self, row, item):
+        at, event, token_id = item
+        row["when"].configure(text=time.strftime("%b %d  %H:%M:%S", time.localtime(at)))
+        row["event"].configure(text=event)
+        row["token"].configure(text=token_id or "")
+
+    def format_last_sync(self, last_sync, now):
+        if not last_sync:
+            return "Last Sync: never"
+        age = max(0, int((now or time.time()) - last_sync))
+        if age < 10:
+            ago = "just now"
+        elif age < 60:
+            ago = f"{age} s ago"
+        elif age < 3600:
+            ago = f"{age // 60} min ago"
+        else:
+            ago = time.strftime("%b %d, %H:%M", time.localtime(last_sync))
+        return f"Last Sync: {ago}"
+
+    def on_token_changed(self, changed):
+        self.app_state.update(changed)
+        if "present" in changed and self.flow.state == DASHBOARD:
+            self.store.log_access(self.flow.current_user, "Token inserted" if changed["present"] else "Token removed",
+                                  self.token_monitor.state["token_id"])
+            if self.history_list is not None and self.history_list.winfo_exists():
+                self.refresh_history()
+
     # =========================================================
     # APPLICATIONS PAGE
     # =========================================================
     def show_applications(self):
-        self.clear_content()
-        ctk.CTkLabel(self.content_frame, text="Manage Applications",
-                     text_color=PINK, font=ctk.CTkFont(size=26, weight="bold")).pack(pady=20)
+        self.views.show("apps")
+
+    def build_applications(self, parent):
+        ctk.CTkLabel(parent, text="Manage Applications",
+                     text_color=PINK, font=self.styles.font("heading")).pack(pady=20)
 
-        container = ctk.CTkFrame(self.content_frame, fg_color=BG_COLOR)
+        container = ctk.CTkFrame(parent, fg_color=BG_COLOR)
         container.pack(fill="both", expand=True, padx=40, pady=30)
 
         try:
-            key_icon = ctk.CTkImage(Image.open("key.png"), size=(50, 50))
-            mic_icon = ctk.CTkImage(Image.open("mic.png"), size=(50, 50))
-            otp_icon = ctk.CTkImage(Image.open("otp.png"), size=(50, 50))
+            key_icon = self.assets.image("key.png", (50, 50))
+            mic_icon = self.assets.image("mic.png", (50, 50))
+            otp_icon = self.assets.image("otp.png", (50, 50))
         except Exception:
             key_icon = mic_icon = otp_icon = None
 
         cards = [
-            {"icon": key_icon, "title": "Password", "info1": "********", "button": "Edit Password"},
-            {"icon": mic_icon, "title": "Voice Biometrics", "info1": "Status: Enrolled", "button": "Edit Biometrics"},
-            {"icon": otp_icon, "title": "OTP Settings", "info1": "Account: a***@gmail.com", "button": "Edit Email Address"}
+            {"icon": key_icon, "title": "Password", "info": "********", "button": "Edit Password"},
+            {"icon": mic_icon, "title": "Voice Biometrics", "key": "voice_enrolled",
+             "format": lambda enrolled: "Status: Enrolled" if enrolled else "Status: Not enrolled",
+             "button": "Edit Biometrics"},
+            {"icon": otp_icon, "title": "OTP Settings", "key": "email",
+             "format": lambda email: f"Account: {mask_email(email)}", "button": "Edit Email Address"}
         ]
 
         for i in range(3):
@@ -369,51 +803,66 @@ class KeyVoxApp(ctk.CTk):
                 ctk.CTkLabel(card_frame, image=card_data["icon"], text="").pack(pady=(15, 10))
 
             ctk.CTkLabel(card_frame, text=card_data["title"],
-                         text_color="white", font=ctk.CTkFont(size=18, weight="bold")).pack()
+                         text_color=TEXT_COLOR, font=self.styles.font("card_title")).pack()
 
-            ctk.CTkLabel(card_frame, text=card_data["info1"],
-                         text_color="white", font=ctk.CTkFont(size=14)).pack(pady=(5, 15))
+            info = ctk.CTkLabel(card_frame, text=card_data.get("info", ""),
+                                text_color=TEXT_COLOR, font=self.styles.font("body"))
+            if "key" in card_data:
+                self.app_state.bind(card_data["key"], info, format=card_data["format"])
+            info.pack(pady=(5, 15))
 
             ctk.CTkButton(card_frame, text=card_data["button"],
                           fg_color=PINK, hover_color=LIGHT_PINK,
-                          text_color="white", corner_radius=20,
+                          text_color=BUTTON_TEXT_COLOR, corner_radius=20,
                           width=160, height=35).pack(pady=(10, 10))
 
     # =========================================================
     # USER PROFILE PAGE
     # =========================================================
     def show_user_profile(self):
-        self.clear_content()
-        ctk.CTkLabel(self.content_frame, text="User Profile",
-                     text_color=PINK, font=ctk.CTkFont(size=26, weight="bold")).pack(pady=30)
+        self.views.show("profile")
+
+    def build_user_profile(self, parent):
+        ctk.CTkLabel(parent, text="User Profile",
+                     text_color=PINK, font=self.styles.font("heading")).pack(pady=30)
 
         fields = {
-            "Name": "Ashley Jewel Heart Malasa",
-            "Username": "ashley_m",
-            "Email Address": "ashley.m@example.com",
-            "Date of Enrollment": "October 5, 2025"
+            "Name": ("full_name", lambda value: value or "-"),
+            "Username": ("username", lambda value: value or "-"),
+            "Email Address": ("email", lambda value: value or "-"),
+            "Date of Enrollment": ("enrolled_at", lambda value: time.strftime("%B %d, %Y", time.localtime(value))
+                                   if value else "Not enrolled on this device"),
         }
 
-        for key, value in fields.items():
-            row = ctk.CTkFrame(self.content_frame, fg_color=CARD_COLOR, corner_radius=10)
+        for name, (key, format) in fields.items():
+            row = ctk.CTkFrame(parent, fg_color=CARD_COLOR, corner_radius=10)
             row.pack(pady=8, padx=250, fill="x")
-            ctk.CTkLabel(row, text=f"{key}:", text_color="white",
-                         font=ctk.CTkFont(size=14, weight="bold")).pack(side="left", padx=10, pady=10)
-            ctk.CTkLabel(row, text=value, text_color="gray80",
-                         font=ctk.CTkFont(size=14)).pack(side="right", padx=10, pady=10)
+            ctk.CTkLabel(row, text=f"{name}:", text_color=TEXT_COLOR,
+                         font=self.styles.font("label")).pack(side="left", padx=10, pady=10)
+            self.app_state.bind(key, ctk.CTkLabel(row, text_color=SUBTEXT_COLOR, font=self.styles.font("body")),
+                                format=format).pack(side="right", padx=10, pady=10)
 
-        ctk.CTkButton(self.content_frame, text="Deactivate Account",
+        ctk.CTkButton(parent, text="Deactivate Account",
                       fg_color=PINK, hover_color=LIGHT_PINK,
                       width=220, height=40, corner_radius=25,
-                      command=self.show_welcome_page).pack(pady=40)
+                      command=self.deactivate_account).pack(pady=40)
+
+    def deactivate_account(self):
+        self.cancel_enrollment()
+        self.app_state.set("voice_enrolled", False)
+        self.voice_index.remove(self.flow.current_user)
+        self.store.delete(self.flow.current_user)
+        self.flow.logout()
 
     # =========================================================
     # ABOUT PAGE
     # =========================================================
     def show_about_page(self):
-        self.clear_content()
-        ctk.CTkLabel(self.content_frame, text="About KeyVox",
-                     text_color=PINK, font=ctk.CTkFont(size=26, weight="bold")).pack(pady=30)
+        self.views.show("about")
+
+    def build_about_page(self, parent):
+        ctk.CTkLabel(parent, text="About KeyVox",
+                     text_color=PINK, font=self.styles.font("heading")).pack(pady=30)
 
         about_text = """
 KeyVox is a cutting-edge voice biometrics security application designed to provide
@@ -424,16 +873,16 @@ passwords and tokens.
 Our mission is to enhance digital security through innovative and user-friendly
 solutions. With KeyVox, your voice truly becomes your key.
 
-Version: 1.0.0
+Version: {version}
 Developed by: KeyVox Technologies
 © 2025 All Rights Reserved.
-        """
-        ctk.CTkLabel(self.content_frame, text=about_text,
-                     text_color="white", font=ctk.CTkFont(size=16), justify="left").pack(pady=20, padx=50)
+        """.format(version=APP_VERSION)
+        ctk.CTkLabel(parent, text=about_text,
+                     text_color=TEXT_COLOR, font=self.styles.font("body_lg"), justify="left").pack(pady=20, padx=50)
 
         try:
-            logo_img = ctk.CTkImage(Image.open("logo.png"), size=(80, 80))
-            ctk.CTkLabel(self.content_frame, image=logo_img, text="").pack(pady=20)
+            logo_img = self.assets.image("logo.png", (80, 80))
+            ctk.CTkLabel(parent, image=logo_img, text="").pack(pady=20)
         except:
             pass
 
@@ -441,25 +890,15 @@ Developed by: KeyVox Technologies
     # HELP PAGE
     # =========================================================
     def show_help_page(self):
-        self.clear_content()
-
-        # --- Create a scrollable frame inside the content frame ---
-        scrollable_frame = ctk.CTkScrollableFrame(
-            self.content_frame,
-            fg_color=BG_COLOR,
-            corner_radius=10
-        )
-        scrollable_frame.pack(fill="both", expand=True, padx=40, pady=20)
-
-        # --- Page Title ---
-        ctk.CTkLabel(
-            scrollable_frame,
-            text="Help & Support",
-            text_color=PINK,
-            font=ctk.CTkFont(size=26, weight="bold")
-        ).pack(pady=30)
-
-        # --- Help Sections ---
+        self.views.show("help")
+
+    def build_help_page(self, parent):
+        ctk.CTkLabel(parent, text="Help & Support", text_color=PINK,
+                     font=self.styles.font("heading")).pack(pady=(20, 10))
+
+        ctk.CTkLabel(parent, text="For urgent issues, please email support@keyvox.com",
+                     text_color=MUTED_COLOR, font=self.styles.font("caption")).pack(side="bottom", pady=(10, 20))
+
         help_sections = {
             "Getting Started": "Learn how to enroll your voice and set up your applications.",
             "Troubleshooting Voice Enrollment": "Tips for successful voice enrollment and common issues.",
@@ -467,51 +906,29 @@ Developed by: KeyVox Technologies
             "Account Security": "Best practices for keeping your account secure.",
             "Contact Support": "Reach out to our support team for personalized assistance."
         }
-
-        for title, description in help_sections.items():
-            section_frame = ctk.CTkFrame(
-                scrollable_frame,
-                fg_color=CARD_COLOR,
-                corner_radius=10
-            )
-            section_frame.pack(pady=10, padx=100, fill="x")
-
-            # Section title
-            ctk.CTkLabel(
-                section_frame,
-                text=title,
-                text_color="white",
-                font=ctk.CTkFont(size=18, weight="bold")
-            ).pack(anchor="w", padx=20, pady=(10, 5))
-
-            # Section description
-            ctk.CTkLabel(
-                section_frame,
-                text=description,
-                text_color="gray80",
-                font=ctk.CTkFont(size=14),
-                wraplength=500,
-                justify="left"
-            ).pack(anchor="w", padx=20, pady=(0, 10))
-
-            # "View Details" button
-            ctk.CTkButton(
-                section_frame,
-                text="View Details",
-                fg_color="transparent",
-                text_color=LIGHT_PINK,
-                hover_color="#2e2e2e",
-                width=120,
-                height=30
-            ).pack(anchor="e", padx=20, pady=(0, 10))
-
-        # --- Footer ---
-        ctk.CTkLabel(
-            scrollable_frame,
-            text="For urgent issues, please email support@keyvox.com",
-            text_color="gray60",
-            font=ctk.CTkFont(size=12)
-        ).pack(pady=30)
+        articles = VirtualList(parent, HELP_ROW_HEIGHT, self.make_help_row, self.bind_help_row,
+                               source=help_sections.items(), count=len(help_sections), fg_color=BG_COLOR)
+        articles.pack(fill="both", expand=True, padx=140)
+
+    def make_help_row(self, container):
+        section_frame = ctk.CTkFrame(container, fg_color=CARD_COLOR, corner_radius=10)
+        section_frame.pack(fill="both", expand=True, pady=5)
+        row = {
+            "title": ctk.CTkLabel(section_frame, text="", text_color=TEXT_COLOR,
+                                  font=self.styles.font("card_title")),
+            "description": ctk.CTkLabel(section_frame, text="", text_color=SUBTEXT_COLOR,
+                                        font=self.styles.font("body"), wraplength=500, justify="left"),
+        }
+        row["title"].pack(anchor="w", padx=20, pady=(10, 5))
+        row["description"].pack(anchor="w", padx=20)
+        ctk.CTkButton(section_frame, text="View Details", fg_color="transparent", text_color=LINK_COLOR,
+                      hover_color=HOVER_COLOR, width=120, height=30).pack(anchor="e", padx=20, pady=(0, 10))
+        return row
+
+    def bind_help_row(self, row, item):
+        title, description = item
+        row["title"].configure(text=title)
+        row["description"].configure(text=description)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,128 @@
+import io
+import json
+import mmap
+import os
+import struct
+from collections import OrderedDict
+
+import customtkinter as ctk
+from PIL import Image
+
+# ========== ASSET SETTINGS ==========
+ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+MAX_IMAGES = 32
+MAX_SOURCES = 4
+HIDPI_FACTOR = 2
+BUNDLE_NAME = "assets.bundle"
+BUNDLE_MAGIC = b"KVXB1"
+
+
+def bundle_key(name, size, scale):
+    return f"{name}@{size[0]}x{size[1]}@{scale}x"
+
+
+class AssetBundle:
+    # Read-only view of a bundle written by build_assets.py. The file is memory-mapped,
+    # so opening it only parses the small JSON index; images are decoded on demand.
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(BUNDLE_MAGIC)] != BUNDLE_MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a KeyVox asset bundle")
+        start = len(BUNDLE_MAGIC) + 4
+        (length,) = struct.unpack_from("<I", self._map, len(BUNDLE_MAGIC))
+        self.index = json.loads(self._map[start:start + length])
+        self._data = start + length
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def load(self, key):
+        offset, length = self.index[key]
+        start = self._data + offset
+        with Image.open(io.BytesIO(self._map[start:start + length])) as img:
+            img.load()
+            return img.copy()
+
+    def close(self):
+        self._map.close()
+
+
+def open_bundle(base_dir=ASSET_DIR):
+    try:
+        return AssetBundle(os.path.join(base_dir, BUNDLE_NAME))
+    except (OSError, ValueError):
+        return None
+
+
+class AssetCache:
+    # Decodes each PNG once and hands out CTkImages keyed by (name, size).
+    # Both the decoded sources and the sized images are bounded LRUs. Sizes found in
+    # the pre-scaled bundle skip the full-size decode and resize entirely; releases ship
+    # only the bundle, so the PNGs are read just in a source checkout.
+    def __init__(self, base_dir=ASSET_DIR, max_images=MAX_IMAGES, max_sources=MAX_SOURCES, scale=1):
+        self.base_dir = base_dir
+        self.max_images = max_images
+        self.max_sources = max_sources
+        self.scale = scale
+        self.bundle = open_bundle(base_dir)
+        self._sources = OrderedDict()
+        self._images = OrderedDict()
+
+    def path(self, name):
+        return name if os.path.isabs(name) else os.path.join(self.base_dir, name)
+
+    def source(self, name):
+        path = self.path(name)
+        if path in self._sources:
+            self._sources.move_to_end(path)
+            return self._sources[path]
+
+        with Image.open(path) as img:
+            img.load()
+            source = img.copy()
+        self._sources[path] = source
+        while len(self._sources) > self.max_sources:
+            self._sources.popitem(last=False)
+        return source
+
+    def image(self, name, size):
+        key = (self.path(name), tuple(size))
+        if key in self._images:
+            self._images.move_to_end(key)
+            return self._images[key]
+
+        width, height = size
+        scaled = self._from_bundle(name, size)
+        if scaled is None:
+            # Keep a 2x copy so CTk's own widget scaling never touches the full-size source
+            source = self.source(name)
+            target = (min(source.width, width * HIDPI_FACTOR), min(source.height, height * HIDPI_FACTOR))
+            scaled = source.resize(target, Image.LANCZOS) if target != source.size else source
+        image = ctk.CTkImage(scaled, size=(width, height))
+
+        self._images[key] = image
+        while len(self._images) > self.max_images:
+            self._images.popitem(last=False)
+        return image
+
+    def _from_bundle(self, name, size):
+        if self.bundle is None or os.path.isabs(name):
+            return None
+        scale = HIDPI_FACTOR if self.scale > 1 else 1
+        for key in (bundle_key(name, size, scale), bundle_key(name, size, HIDPI_FACTOR)):
+            if key in self.bundle:
+                return self.bundle.load(key)
+        return None
+
+    def preload(self, specs):
+        for name, size in specs:
+            try:
+                self.image(name, size)
+            except Exception:
+                pass
+
+    def clear(self):
+        self._sources.clear()
+        self._images.clear()
@@ -0,0 +1,244 @@
+import os
+import threading
+import wave
+
+import numpy as np
+
+from workers import Worker
+
+try:
+    import sounddevice as sd
+except (ImportError, OSError):
+    sd = None
+
+# ========== CAPTURE SETTINGS ==========
+SAMPLE_RATE = 16000
+CHUNK_FRAMES = 1024
+MAX_PHRASE_SECONDS = 8
+VAD_FRAME_MS = 20
+VAD_RELATIVE_DB = 30
+VAD_FLOOR = 1e-5
+VAD_PAD_FRAMES = 2
+END_SILENCE_SECONDS = 0.8
+# Audio that arrives while no read is waiting is held this long before the oldest is dropped
+SPILL_SECONDS = 1.0
+READ_TIMEOUT_SECONDS = 1.0
+WAV_INPUT_ENV = "KEYVOX_WAV_INPUT"
+
+
+# =========================================================
+# SAMPLE BUFFER
+# =========================================================
+class RingBuffer:
+    # Preallocated float32 ring. Sources write straight into views of it, so the
+    # capture loop never allocates per chunk. Single writer, any number of readers.
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.data = np.zeros(capacity, dtype=np.float32)
+        self.total = 0
+
+    def reset(self):
+        self.total = 0
+
+    def fill(self, readinto, frames):
+        start = self.total % self.capacity
+        count = readinto(self.data[start:start + min(frames, self.capacity - start)])
+        self.total += count
+        return count
+
+    def latest(self, count):
+        count = min(count, self.total, self.capacity)
+        end = self.total % self.capacity
+        if count <= end:
+            return self.data[end - count:end]
+        return np.concatenate((self.data[self.capacity - (count - end):], self.data[:end]))
+
+
+# =========================================================
+# INPUT SOURCES
+# =========================================================
+class WavSource:
+    # Reads 16-bit PCM from a WAV file; the first channel is used
+    def __init__(self, path):
+        self.path = path
+        self._wav = None
+
+    def __enter__(self):
+        self._wav = wave.open(self.path, "rb")
+        if self._wav.getsampwidth() != 2:
+            self._wav.close()
+            raise ValueError(f"{self.path}: only 16-bit PCM WAV files are supported")
+        self.sample_rate = self._wav.getframerate()
+        self.channels = self._wav.getnchannels()
+        self.frames = self._wav.getnframes()
+        return self
+
+    def __exit__(self, *exc):
+        self._wav.close()
+
+    def readinto(self, out):
+        pcm = np.frombuffer(self._wav.readframes(len(out)), dtype=np.int16)
+        if self.channels > 1:
+            pcm = pcm[::self.channels]
+        np.multiply(pcm, 1 / 32768, out=out[:len(pcm)], casting="unsafe")
+        return len(pcm)
+
+
+class MicrophoneSource:
+    # PortAudio's callback copies each block straight into the view readinto() is
+    # waiting on (a slice of the caller's RingBuffer), so capture makes one copy per
+    # block and allocates nothing. Blocks that arrive while no read is waiting go to
+    # a preallocated spill ring, which the next read drains first.
+    def __init__(self, sample_rate=SAMPLE_RATE, device=None, spill_seconds=SPILL_SECONDS):
+        if sd is None:
+            raise RuntimeError("Microphone capture needs the sounddevice package and PortAudio")
+        self.sample_rate = sample_rate
+        self.device = device
+        self._stream = None
+        self._spill = RingBuffer(int(sample_rate * spill_seconds))
+        self._taken = 0
+        self._out = None
+        self._filled = 0
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+
+    def __enter__(self):
+        self._stream = sd.InputStream(samplerate=self.sample_rate, channels=1, dtype="float32",
+                                      device=self.device, callback=self._callback)
+        self._stream.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stream.stop()
+        self._stream.close()
+
+    def readinto(self, out):
+        with self._lock:
+            count = self._take_spill(out)
+            if count == len(out):
+                return count
+            self._out, self._filled = out, count
+            self._ready.clear()
+        self._ready.wait(READ_TIMEOUT_SECONDS)
+        with self._lock:
+            count, self._out = self._filled, None
+        return count
+
+    def _callback(self, indata, frames, time, status):
+        # PortAudio thread; indata is a view of PortAudio's own buffer
+        samples = indata[:, 0]
+        with self._lock:
+            if self._out is not None:
+                take = min(len(samples), len(self._out) - self._filled)
+                self._out[self._filled:self._filled + take] = samples[:take]
+                self._filled += take
+                samples = samples[take:]
+                if self._filled == len(self._out):
+                    self._out = None
+                    self._ready.set()
+            if len(samples):
+                self._spill_samples(samples)
+
+    def _spill_samples(self, samples):
+        spill = self._spill
+        while len(samples):
+            start = spill.total % spill.capacity
+            count = min(len(samples), spill.capacity - start)
+            spill.data[start:start + count] = samples[:count]
+            spill.total += count
+            samples = samples[count:]
+        # A reader that fell more than a spill ring behind loses the oldest audio
+        self._taken = max(self._taken, spill.total - spill.capacity)
+
+    def _take_spill(self, out):
+        spill = self._spill
+        count = min(spill.total - self._taken, len(out))
+        start = self._taken % spill.capacity
+        first = min(count, spill.capacity - start)
+        out[:first] = spill.data[start:start + first]
+        out[first:count] = spill.data[:count - first]
+        self._taken += count
+        return count
+
+
+def default_source():
+    # KEYVOX_WAV_INPUT points at a WAV file so capture runs headless in CI
+    path = os.environ.get(WAV_INPUT_ENV)
+    return WavSource(path) if path else MicrophoneSource()
+
+
+# =========================================================
+# VOICE ACTIVITY DETECTION
+# =========================================================
+def frame_energy(samples, frame):
+    count = len(samples) // frame
+    frames = samples[:count * frame].reshape(count, frame)
+    return np.einsum("ij,ij->i", frames, frames) / frame
+
+
+def trim_silence(samples, sample_rate, frame_ms=VAD_FRAME_MS, relative_db=VAD_RELATIVE_DB):
+    # Returns a view of samples without leading/trailing frames quieter than
+    # relative_db below the loudest frame; empty if nothing rises above the floor
+    frame = max(1, sample_rate * frame_ms // 1000)
+    energy = frame_energy(samples, frame)
+    if not len(energy) or energy.max() <= VAD_FLOOR:
+        return samples[:0]
+    threshold = max(VAD_FLOOR, energy.max() * 10 ** (-relative_db / 10))
+    voiced = np.flatnonzero(energy > threshold)
+    start = max(0, voiced[0] - VAD_PAD_FRAMES) * frame
+    end = min(len(energy), voiced[-1] + 1 + VAD_PAD_FRAMES) * frame
+    return samples[start:end]
+
+
+# =========================================================
+# PHRASE RECORDER
+# =========================================================
+class PhraseRecorder(Worker):
+    # Captures one phrase per start(tag). Finished phrases are put on `results` as
+    # (tag, samples, sample_rate, error).
+    def __init__(self, source_factory=default_source, max_seconds=MAX_PHRASE_SECONDS,
+                 chunk_frames=CHUNK_FRAMES):
+        super().__init__()
+        self.source_factory = source_factory
+        self.max_seconds = max_seconds
+        self.chunk_frames = chunk_frames
+        self.buffer = RingBuffer(int(SAMPLE_RATE * max_seconds))
+        self.sample_rate = SAMPLE_RATE
+
+    def _run(self, tag):
+        try:
+            with self.source_factory() as source:
+                self.sample_rate = source.sample_rate
+                capacity = int(source.sample_rate * self.max_seconds)
+                if capacity != self.buffer.capacity:
+                    self.buffer = RingBuffer(capacity)
+                self.buffer.reset()
+                samples = self._capture(source)
+            self.results.put((tag, trim_silence(samples, self.sample_rate).copy(), self.sample_rate, None))
+        except Exception as e:
+            self.results.put((tag, None, self.sample_rate, e))
+
+    def _capture(self, source):
+        buffer = self.buffer
+        frame = max(1, source.sample_rate * VAD_FRAME_MS // 1000)
+        end_silence = int(source.sample_rate * END_SILENCE_SECONDS)
+        peak = 0.0
+        silent = 0
+        while not self._stop.is_set() and buffer.total < buffer.capacity:
+            count = buffer.fill(source.readinto, self.chunk_frames)
+            if not count:
+                break
+
+            # Cheap end-pointing: stop after END_SILENCE_SECONDS of quiet following speech
+            energy = frame_energy(buffer.latest(count), frame)
+            if not len(energy):
+                continue
+            peak = max(peak, float(energy.max()))
+            threshold = max(VAD_FLOOR, peak * 10 ** (-VAD_RELATIVE_DB / 10))
+            if peak > VAD_FLOOR and energy.max() <= threshold:
+                silent += count
+                if silent >= end_silence:
+                    break
+            else:
+                silent = 0
+        return buffer.latest(buffer.total)
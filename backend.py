@@ -0,0 +1,231 @@
+import asyncio
+import json
+import os
+import ssl
+import threading
+from urllib.parse import urlsplit
+
+from workers import ResultBridge
+
+# ========== BACKEND SETTINGS ==========
+BACKEND_URL_ENV = "KEYVOX_BACKEND_URL"
+REQUEST_TIMEOUT = 10.0
+MAX_CONNECTIONS = 4
+
+
+class BackendError(Exception):
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+class Response:
+    def __init__(self, status, reason, headers, body):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+
+    @property
+    def ok(self):
+        return 200 <= self.status < 300
+
+    def json(self):
+        return json.loads(self.body or b"null")
+
+
+# =========================================================
+# EVENT LOOP THREAD
+# =========================================================
+class LoopThread:
+    # A private asyncio loop on a daemon thread; coroutines are handed over with submit()
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name="keyvox-backend", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=1)
+
+
+# =========================================================
+# POOLED HTTP/1.1 CLIENT
+# =========================================================
+class HttpClient:
+    # Minimal keep-alive HTTP/1.1 client on asyncio streams. Idle connections are
+    # reused LIFO and at most max_connections are open at once. Must only be used
+    # from the loop it was first awaited on.
+    def __init__(self, base_url, max_connections=MAX_CONNECTIONS, timeout=REQUEST_TIMEOUT):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.secure = parts.scheme == "https"
+        self.port = parts.port or (443 if self.secure else 80)
+        self.prefix = parts.path.rstrip("/")
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self._idle = []
+        self._slots = None
+
+    async def request(self, method, path, body=None, timeout=None):
+        return await asyncio.wait_for(self._request(method, path, body), timeout or self.timeout)
+
+    async def get(self, path, **kwargs):
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path, body=None, **kwargs):
+        return await self.request("POST", path, body, **kwargs)
+
+    async def close(self):
+        while self._idle:
+            self._idle.pop()[1].close()
+
+    async def _request(self, method, path, body):
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_connections)
+        payload = b"" if body is None else json.dumps(body).encode()
+        async with self._slots:
+            # A reused connection may have been closed by the server; retry once on a fresh one
+            while True:
+                reused = bool(self._idle)
+                reader, writer = self._idle.pop() if reused else await asyncio.open_connection(
+                    self.host, self.port, ssl=ssl.create_default_context() if self.secure else None)
+                try:
+                    writer.write(self._encode(method, path, payload))
+                    await writer.drain()
+                    response, keep_alive = await self._read_response(reader)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    writer.close()
+                    if reused:
+                        continue
+                    raise
+                except BaseException:
+                    writer.close()
+                    raise
+                if keep_alive:
+                    self._idle.append((reader, writer))
+                else:
+                    writer.close()
+                return response
+
+    def _encode(self, method, path, payload):
+        lines = [f"{method} {self.prefix}{path} HTTP/1.1",
+                 f"Host: {self.host}:{self.port}",
+                 "Connection: keep-alive",
+                 "Accept: application/json",
+                 f"Content-Length: {len(payload)}"]
+        if payload:
+            lines.append("Content-Type: application/json")
+        return ("\r\n".join(lines) + "\r\n\r\n").encode() + payload
+
+    async def _read_response(self, reader):
+        status_line = await reader.readuntil(b"\r\n")
+        _version, status, *reason = status_line.decode("latin-1").split(" ", 2)
+        headers = {}
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                chunk = await reader.readexactly(size + 2)
+                if not size:
+                    break
+                chunks.append(chunk[:-2])
+            body = b"".join(chunks)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await reader.read()
+            headers["connection"] = "close"
+
+        keep_alive = headers.get("connection", "").lower() != "close"
+        reason = reason[0].strip() if reason else ""
+        return Response(int(status), reason, headers, body), keep_alive
+
+
+async def call(http, method, path, body=None, timeout=None):
+    # One JSON API call: the decoded body, or BackendError carrying the server's message
+    response = await http.request(method, path, body, timeout=timeout)
+    if not response.ok:
+        try:
+            message = response.json().get("error", response.reason)
+        except (ValueError, AttributeError):
+            message = response.reason
+        raise BackendError(message, response.status)
+    return response.json()
+
+
+# =========================================================
+# TK BRIDGE
+# =========================================================
+class BackendClient:
+    # Runs requests on the loop thread and delivers results on the Tk thread through a
+    # ResultBridge. Requests carry a scope so a page can cancel
+    # everything it started when the user navigates away.
+    def __init__(self, base_url, widget, timeout=REQUEST_TIMEOUT, max_connections=MAX_CONNECTIONS):
+        self.widget = widget
+        self.http = HttpClient(base_url, max_connections=max_connections, timeout=timeout)
+        self._loop = None
+        self._pending = {}
+        self._results = ResultBridge(widget)
+
+    @classmethod
+    def from_env(cls, widget):
+        url = os.environ.get(BACKEND_URL_ENV)
+        return cls(url, widget) if url else None
+
+    def request(self, method, path, body=None, on_done=None, on_error=None, scope=None, timeout=None):
+        if self._loop is None:
+            self._loop = LoopThread()
+        future = self._loop.submit(call(self.http, method, path, body, timeout))
+        self._pending[future] = (scope, on_done, on_error)
+        return self._results.watch(future, self._complete)
+
+    def post(self, path, body=None, **kwargs):
+        return self.request("POST", path, body, **kwargs)
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def cancel(self, scope=None):
+        for future, (future_scope, _, _) in list(self._pending.items()):
+            if scope is None or future_scope == scope:
+                del self._pending[future]
+                future.cancel()
+
+    def close(self):
+        self.cancel()
+        if self._loop is not None:
+            try:
+                self._loop.submit(self.http.close()).result(timeout=1)
+            except Exception:
+                pass
+            self._loop.stop()
+            self._loop = None
+
+    def _complete(self, future):
+        entry = self._pending.pop(future, None)
+        if entry is None or future.cancelled():
+            return
+        _, on_done, on_error = entry
+        error = future.exception()
+        if error is None:
+            if on_done:
+                on_done(future.result())
+        elif on_error:
+            on_error(error)
+        else:
+            print(f"Backend error: {error}")
@@ -0,0 +1,203 @@
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+# ========== BENCHMARK SETTINGS ==========
+XVFB_DISPLAY = ":99"
+DEFAULT_REPEAT = 5
+DEFAULT_NAVIGATIONS = 200
+
+# Latency budgets in milliseconds (median of the repeats); override with --budgets FILE
+BUDGETS_MS = {
+    "build:welcome": 250,
+    "build:login": 250,
+    "build:enrollment_step1": 250,
+    "build:enrollment_step2": 300,
+    "build:enrollment_step3": 250,
+    "build:enrollment_summary": 250,
+    "build:dashboard": 400,
+    "build:applications": 250,
+    "build:user_profile": 250,
+    "build:help": 300,
+    "build:about": 250,
+    "navigate:home": 50,
+    "navigate:apps": 50,
+    "navigate:profile": 50,
+}
+MAX_WIDGET_GROWTH = 0
+MAX_RSS_GROWTH_MB = 10
+
+PAGE_BUILDS = [
+    ("welcome", lambda app: app.show_welcome_page()),
+    ("login", lambda app: app.show_login_page()),
+    ("enrollment_step1", lambda app: app.show_enrollment_step1()),
+    ("enrollment_step2", lambda app: app.show_enrollment_step2()),
+    ("enrollment_step3", lambda app: app.show_enrollment_step3()),
+    ("enrollment_summary", lambda app: app.show_enrollment_summary()),
+    ("dashboard", lambda app: app.show_dashboard("bench")),
+]
+# Dashboard pages are timed on their first visit after a fresh show_dashboard
+CONTENT_BUILDS = [
+    ("applications", lambda app: app.show_applications()),
+    ("user_profile", lambda app: app.show_user_profile()),
+    ("help", lambda app: app.show_help_page()),
+    ("about", lambda app: app.show_about_page()),
+]
+NAVIGATIONS = [
+    ("home", lambda app: app.navigate_to_home()),
+    ("apps", lambda app: app.navigate_to_apps()),
+    ("profile", lambda app: app.navigate_to_profile()),
+]
+
+
+def ensure_display():
+    # Reuse $DISPLAY when there is one, otherwise start a private Xvfb server
+    if os.environ.get("DISPLAY"):
+        return None
+    if shutil.which("Xvfb") is None:
+        sys.exit("No $DISPLAY and Xvfb is not installed; run under a display or install Xvfb.")
+    server = subprocess.Popen(["Xvfb", XVFB_DISPLAY, "-screen", "0", "1280x800x24", "-nolisten", "tcp"],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.environ["DISPLAY"] = XVFB_DISPLAY
+    time.sleep(0.5)
+    return server
+
+
+def rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def widget_count(widget):
+    return sum(1 + widget_count(child) for child in widget.winfo_children())
+
+
+def settle(app):
+    # update_idletasks would also run every queued prewarm task, which would bill page
+    # builds to whatever action queued them and leave later builds already done
+    app.prewarmer.cancel()
+    app.update_idletasks()
+
+
+def timed(app, action):
+    # Includes the idle-time geometry and redraw work the action queues up
+    start = time.perf_counter()
+    action(app)
+    settle(app)
+    return (time.perf_counter() - start) * 1000
+
+
+def run(repeat=DEFAULT_REPEAT, navigations=DEFAULT_NAVIGATIONS):
+    from app import PREWARM_VIEWS, KeyVoxApp
+
+    start = time.perf_counter()
+    app = KeyVoxApp()
+    app.update()
+    results = {"startup_ms": (time.perf_counter() - start) * 1000, "startup": app.startup.summary(), "timings": {}}
+    timings = results["timings"]
+
+    for name, action in PAGE_BUILDS:
+        timings[f"build:{name}"] = [timed(app, action) for _ in range(repeat)]
+
+    for name, action in CONTENT_BUILDS:
+        samples = []
+        for _ in range(repeat):
+            app.show_dashboard("bench")
+            settle(app)
+            samples.append(timed(app, action))
+        timings[f"build:{name}"] = samples
+
+    # The background page builds show_dashboard queues, timed on their own
+    samples = []
+    for _ in range(repeat):
+        app.show_dashboard("bench")
+        app.prewarmer.cancel()
+        start = time.perf_counter()
+        app.prewarmer.add([(f"view:{name}", lambda name=name: app.views.prewarm(name)) for name in PREWARM_VIEWS])
+        app.update_idletasks()
+        samples.append((time.perf_counter() - start) * 1000)
+    timings["prewarm:dashboard_views"] = samples
+
+    # Warm every dashboard page once, then look for growth across repeated navigation
+    app.show_dashboard("bench")
+    for _, action in NAVIGATIONS:
+        action(app)
+    app.update()
+    widgets_before, rss_before = widget_count(app), rss_mb()
+    for name, _ in NAVIGATIONS:
+        timings[f"navigate:{name}"] = []
+    for i in range(navigations):
+        name, action = NAVIGATIONS[i % len(NAVIGATIONS)]
+        timings[f"navigate:{name}"].append(timed(app, action))
+    app.update()
+    results["widgets"] = {"before": widgets_before, "after": widget_count(app)}
+    results["rss_mb"] = {"before": rss_before, "after": rss_mb()}
+
+    app.on_close()
+    return results
+
+
+def check(results, budgets):
+    failures = []
+    for key, samples in results["timings"].items():
+        median = statistics.median(samples)
+        if key in budgets and median > budgets[key]:
+            failures.append(f"{key}: median {median:.1f} ms > budget {budgets[key]} ms")
+    growth = results["widgets"]["after"] - results["widgets"]["before"]
+    if growth > MAX_WIDGET_GROWTH:
+        failures.append(f"widget count grew by {growth} over repeated navigation")
+    rss_growth = results["rss_mb"]["after"] - results["rss_mb"]["before"]
+    if rss_growth > MAX_RSS_GROWTH_MB:
+        failures.append(f"RSS grew by {rss_growth:.1f} MB over repeated navigation")
+    return failures
+
+
+def report(results, budgets):
+    print(f"startup: {results['startup_ms']:.1f} ms")
+    marks = results["startup"]["marks_ms"]
+    print("  " + ", ".join(f"{name} {ms:.1f} ms" for name, ms in marks.items()) + " (from process start)")
+    print(f"{'measurement':<28} {'median ms':>10} {'max ms':>9} {'budget':>8}")
+    for key, samples in results["timings"].items():
+        print(f"{key:<28} {statistics.median(samples):>10.2f} {max(samples):>9.2f} {budgets.get(key, '-'):>8}")
+    widgets, rss = results["widgets"], results["rss_mb"]
+    print(f"widgets: {widgets['before']} -> {widgets['after']}")
+    print(f"rss: {rss['before']:.1f} MB -> {rss['after']:.1f} MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time KeyVox page builds and navigation headlessly")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--navigations", type=int, default=DEFAULT_NAVIGATIONS)
+    parser.add_argument("--budgets", help="JSON file of {measurement: budget_ms} overrides")
+    parser.add_argument("--json", help="also write raw results to this file")
+    args = parser.parse_args()
+
+    budgets = dict(BUDGETS_MS)
+    if args.budgets:
+        with open(args.budgets) as f:
+            budgets.update(json.load(f))
+
+    xvfb = ensure_display()
+    try:
+        results = run(args.repeat, args.navigations)
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+    report(results, budgets)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    failures = check(results, budgets)
+    for failure in failures:
+        print(f"FAIL {failure}")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,72 @@
+import argparse
+import io
+import json
+import os
+import re
+import struct
+
+from PIL import Image
+
+from assets import ASSET_DIR, BUNDLE_MAGIC, BUNDLE_NAME, bundle_key
+
+# ========== BUILD SETTINGS ==========
+# Releases run this script and ship assets.bundle next to the code in place of the
+# PNGs: it holds every size app.py asks for, so the originals are only read in a
+# source checkout, where the bundle is not built (it is gitignored).
+SCALES = (1, 2)
+SOURCES = ("app.py",)
+IMAGE_CALL = re.compile(r'assets\.image\("([\w.\-]+)", \((\d+), (\d+)\)\)')
+
+
+def requested_sizes(base_dir=ASSET_DIR, sources=SOURCES):
+    # Every (name, (width, height)) the UI asks the asset cache for
+    specs = set()
+    for source in sources:
+        with open(os.path.join(base_dir, source), encoding="utf-8") as f:
+            for name, width, height in IMAGE_CALL.findall(f.read()):
+                specs.add((name, (int(width), int(height))))
+    return sorted(specs)
+
+
+def encode(image):
+    out = io.BytesIO()
+    image.save(out, format="PNG", optimize=True)
+    return out.getvalue()
+
+
+def build(output, base_dir=ASSET_DIR, scales=SCALES):
+    # Bundle layout: magic, u32 index length, JSON index {key: [offset, length]}, blobs.
+    # Offsets are relative to the start of the blob area.
+    specs = requested_sizes(base_dir)
+    index, blobs, offset = {}, [], 0
+    for name in sorted({name for name, _ in specs}):
+        with Image.open(os.path.join(base_dir, name)) as source:
+            source.load()
+            for spec_name, (width, height) in specs:
+                if spec_name != name:
+                    continue
+                for scale in scales:
+                    blob = encode(source.resize((width * scale, height * scale), Image.LANCZOS))
+                    index[bundle_key(name, (width, height), scale)] = [offset, len(blob)]
+                    blobs.append(blob)
+                    offset += len(blob)
+
+    header = json.dumps(index, sort_keys=True).encode()
+    with open(output, "wb") as f:
+        f.write(BUNDLE_MAGIC + struct.pack("<I", len(header)) + header)
+        for blob in blobs:
+            f.write(blob)
+    return index, offset
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-scale UI images into a single asset bundle")
+    parser.add_argument("--output", default=os.path.join(ASSET_DIR, BUNDLE_NAME))
+    args = parser.parse_args()
+
+    index, size = build(args.output)
+    names = sorted({key.split("@")[0] for key in index})
+    originals = sum(os.path.getsize(os.path.join(ASSET_DIR, name)) for name in names)
+    print(f"Wrote {len(index)} images to {args.output}: {size / 1024:.0f} KB "
+          f"(source PNGs {originals / 1024:.0f} KB)")
+    print("A release ships the bundle instead of: " + " ".join(names))
@@ -0,0 +1,177 @@
+import argparse
+import base64
+import hashlib
+import hmac
+import math
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from workers import ResultBridge
+
+# ========== HASHING SETTINGS ==========
+TARGET_MS = 250
+SCRYPT_R = 8
+SCRYPT_P = 1
+MIN_LOG_N = 12
+MAX_LOG_N = 20
+CALIBRATION_LOG_N = 12
+SALT_BYTES = 16
+KEY_BYTES = 32
+MAX_WORKERS = 4
+
+
+def scrypt(password, salt, n, r, p):
+    # maxmem must cover scrypt's 128 * r * n byte working set
+    return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p,
+                          maxmem=256 * r * n + 2 ** 20, dklen=KEY_BYTES)
+
+
+def b64(raw):
+    return base64.b64encode(raw).decode()
+
+
+def hash_password(password, params):
+    # -> "scrypt$n$r$p$salt$key", everything verification needs travels with the hash
+    n, r, p = params
+    salt = os.urandom(SALT_BYTES)
+    key = scrypt(password, salt, n, r, p)
+    return f"scrypt${n}${r}${p}${b64(salt)}${b64(key)}"
+
+
+def parse_hash(encoded):
+    scheme, n, r, p, salt, key = encoded.split("$")
+    if scheme != "scrypt":
+        raise ValueError(f"Unsupported password hash scheme: {scheme}")
+    return (int(n), int(r), int(p)), base64.b64decode(salt), base64.b64decode(key)
+
+
+def verify_password(password, encoded):
+    try:
+        (n, r, p), salt, key = parse_hash(encoded)
+    except ValueError:
+        return False
+    return hmac.compare_digest(scrypt(password, salt, n, r, p), key)
+
+
+def calibrate(target_ms=TARGET_MS, r=SCRYPT_R, p=SCRYPT_P):
+    # scrypt time is linear in n: time one small hash, then take the largest power of
+    # two that fits the target. Runs once per process, off the Tk thread.
+    n = 2 ** CALIBRATION_LOG_N
+    start = time.perf_counter()
+    scrypt("calibration", b"\0" * SALT_BYTES, n, r, p)
+    elapsed_ms = max((time.perf_counter() - start) * 1000, 1e-3)
+    log_n = CALIBRATION_LOG_N + math.floor(math.log2(target_ms / elapsed_ms))
+    return 2 ** min(MAX_LOG_N, max(MIN_LOG_N, log_n)), r, p
+
+
+# =========================================================
+# CREDENTIAL SERVICE
+# =========================================================
+class CredentialService:
+    # Hashes and verifies on a worker pool; hashlib.scrypt releases the GIL, so threads
+    # run in parallel without the start-up cost of worker processes. Calibration starts
+    # immediately in the pool and new hashes wait for it. With a widget, callbacks are
+    # delivered on the Tk thread through a ResultBridge.
+    def __init__(self, widget=None, target_ms=TARGET_MS, max_workers=None):
+        self.widget = widget
+        self.target_ms = target_ms
+        self._pool = ThreadPoolExecutor(max_workers=max_workers or min(MAX_WORKERS, os.cpu_count() or 1),
+                                        thread_name_prefix="keyvox-credentials")
+        self._params = self._pool.submit(calibrate, target_ms)
+        self._results = ResultBridge(widget)
+
+    @property
+    def params(self):
+        return self._params.result()
+
+    def hash(self, password, on_done=None, on_error=None):
+        future = self._pool.submit(lambda: hash_password(password, self.params))
+        return self._deliver(future, on_done, on_error)
+
+    def verify(self, password, encoded, on_done=None, on_error=None):
+        future = self._pool.submit(verify_password, password, encoded)
+        return self._deliver(future, on_done, on_error)
+
+    def verify_many(self, items, on_done=None, on_progress=None):
+        # Bulk-import check of (password, encoded) pairs. on_progress(done, total) fires
+        # as results arrive; on_done gets the booleans in input order.
+        items = list(items)
+        futures = [self._pool.submit(verify_password, password, encoded) for password, encoded in items]
+        state = {"done": 0}
+        lock = threading.Lock()
+
+        def progress(_result):
+            # Without a widget this runs on the worker threads
+            with lock:
+                state["done"] += 1
+                done = state["done"]
+            if on_progress:
+                on_progress(done, len(futures))
+            if done == len(futures) and on_done:
+                on_done([future.result() for future in futures])
+
+        for future in futures:
+            self._deliver(future, progress, None)
+        if not futures and on_done:
+            on_done([])
+        return futures
+
+    def needs_rehash(self, encoded):
+        # Hashes made on a slower host or with an older target are upgraded at next login
+        try:
+            params, _, _ = parse_hash(encoded)
+        except ValueError:
+            return True
+        return params[0] < self.params[0] or params[1:] != self.params[1:]
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _deliver(self, future, on_done, on_error):
+        if on_done is None and on_error is None:
+            return future
+        return self._results.watch(future, lambda f: self._complete(f, on_done, on_error))
+
+    def _complete(self, future, on_done, on_error):
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is None:
+            if on_done:
+                on_done(future.result())
+        elif on_error:
+            on_error(error)
+        else:
+            print(f"Credential error: {error}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Calibrate password hashing and time a bulk verification")
+    parser.add_argument("--target-ms", type=float, default=TARGET_MS)
+    parser.add_argument("--batch", type=int, default=16, help="number of credentials to verify")
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args()
+
+    service = CredentialService(target_ms=args.target_ms, max_workers=args.workers)
+    start = time.perf_counter()
+    n, r, p = service.params
+    print(f"calibrated scrypt n=2^{int(math.log2(n))} r={r} p={p} in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    start = time.perf_counter()
+    encoded = service.hash("correct horse").result()
+    print(f"hash: {(time.perf_counter() - start) * 1000:.0f} ms (target {args.target_ms:.0f} ms)")
+
+    items = [("correct horse" if i % 4 else "wrong", encoded) for i in range(args.batch)]
+    results = []
+    finished = threading.Event()
+    start = time.perf_counter()
+    service.verify_many(items, on_done=lambda matched: (results.extend(matched), finished.set()),
+                        on_progress=lambda done, total: print(f"\rverified {done}/{total}", end="", file=sys.stderr))
+    finished.wait()
+    elapsed = time.perf_counter() - start
+    print(f"\nbatch: {len(items)} in {elapsed:.2f} s ({elapsed * 1000 / max(len(items), 1):.0f} ms each), "
+          f"{sum(results)} matched")
+    service.shutdown()
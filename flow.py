@@ -0,0 +1,180 @@
+# ========== FLOW STATES ==========
+WELCOME = "welcome"
+LOGIN = "login"
+ENROLL_INFO = "enroll_info"
+ENROLL_VOICE = "enroll_voice"
+ENROLL_OTP = "enroll_otp"
+ENROLL_SUMMARY = "enroll_summary"
+DASHBOARD = "dashboard"
+
+TRANSITIONS = {
+    WELCOME: {LOGIN},
+    LOGIN: {WELCOME, ENROLL_INFO, DASHBOARD},
+    ENROLL_INFO: {LOGIN, ENROLL_VOICE},
+    ENROLL_VOICE: {ENROLL_INFO, ENROLL_OTP},
+    ENROLL_OTP: {ENROLL_VOICE, ENROLL_SUMMARY},
+    ENROLL_SUMMARY: {DASHBOARD},
+    DASHBOARD: {WELCOME},
+}
+BACK = {LOGIN: WELCOME, ENROLL_INFO: LOGIN, ENROLL_VOICE: ENROLL_INFO, ENROLL_OTP: ENROLL_VOICE}
+ENROLLMENT_FIELDS = ("Full Name", "Username", "Password", "Confirm Password", "Email Address")
+# Never kept in enrollment_data; the app hashes the password and reports back via password_hashed
+PASSWORD_FIELDS = ("Password", "Confirm Password")
+
+ERROR = "error"
+INFO = "info"
+
+
+class FlowError(Exception):
+    pass
+
+
+class Request:
+    # A backend call the flow needs made. Whoever owns the transport sends it and reports
+    # back through done()/failed(); results that arrive after the flow moved on are dropped.
+    def __init__(self, flow, method, path, body, on_done):
+        self.flow = flow
+        self.method = method
+        self.path = path
+        self.body = body
+        self.state = flow.state
+        self._on_done = on_done
+
+    def done(self, result):
+        if self.flow.state == self.state:
+            self._on_done(result or {})
+
+    def failed(self, error):
+        if self.flow.state == self.state:
+            self.flow.notify_message(str(error))
+
+
+class AuthFlow:
+    # Welcome -> login -> enrollment steps 1-3 -> summary -> dashboard, with no Tk in it.
+    # Listeners are called as listener(event, flow) with event "state" or "message". With
+    # remote=False every step completes locally; with remote=True the intents that need
+    # the backend return a Request instead of moving on.
+    def __init__(self, remote=False):
+        self.remote = remote
+        self.state = WELCOME
+        self.enrollment_data = {}
+        self.enrollment_phrases = {}
+        self.password_hash = None
+        self.current_user = None
+        self.message = None
+        self._listeners = []
+
+    def subscribe(self, listener):
+        self._listeners.append(listener)
+
+    def notify_message(self, text, kind=ERROR):
+        self.message = (text, kind)
+        for listener in list(self._listeners):
+            listener("message", self)
+
+    def go(self, state):
+        if state not in TRANSITIONS[self.state]:
+            raise FlowError(f"Cannot go from {self.state} to {state}")
+        self.state = state
+        self.message = None
+        for listener in list(self._listeners):
+            listener("state", self)
+
+    # --- Intents ---
+    def get_started(self):
+        self.go(LOGIN)
+
+    def back(self):
+        self.go(BACK[self.state])
+
+    def start_enrollment(self):
+        self.go(ENROLL_INFO)
+
+    def login(self, username, password):
+        if not (username and password):
+            self.notify_message("Please enter both username and password.")
+            return None
+        if not self.remote:
+            self._enter_dashboard(username)
+            return None
+        self.notify_message("Signing in...", INFO)
+        return Request(self, "POST", "/login", {"username": username, "password": password},
+                       lambda result: self._enter_dashboard(result.get("username", username)))
+
+    def voice_login(self, username, enrolled):
+        # Checked before the app starts listening; the verdict comes back via voice_verified
+        if not username:
+            self.notify_message("Enter your username to log in by voice.")
+            return False
+        if not enrolled:
+            self.notify_message("No voiceprint enrolled for this user.")
+            return False
+        self.notify_message("Listening... say your phrase.", INFO)
+        return True
+
+    def voice_verified(self, username, accepted):
+        if self.state != LOGIN:
+            return
+        if accepted:
+            self._enter_dashboard(username)
+        else:
+            self.notify_message("Voice not recognised. Try again or use your password.")
+
+    def submit_enrollment_info(self, data):
+        if not data.get("Password"):
+            self.notify_message("Please choose a password.")
+            return False
+        if data.get("Password") != data.get("Confirm Password"):
+            self.notify_message("Passwords do not match.")
+            return False
+        if data.get("Username") != self.enrollment_data.get("Username"):
+            self.enrollment_phrases = {}
+        self.enrollment_data = {field: value for field, value in data.items() if field not in PASSWORD_FIELDS}
+        self.password_hash = None
+        self.go(ENROLL_VOICE)
+        return True
+
+    def password_hashed(self, encoded):
+        self.password_hash = encoded
+
+    def phrase_recorded(self, index, samples, sample_rate):
+        self.enrollment_phrases[index] = (samples, sample_rate)
+
+    def finish_voice_enrollment(self):
+        self.go(ENROLL_OTP)
+
+    def send_code(self):
+        if not self.remote:
+            return None
+        self.notify_message("Sending code...", INFO)
+        return Request(self, "POST", "/otp/send", {"email": self.enrollment_data.get("Email Address", "")},
+                       lambda result: self.notify_message("Code sent.", INFO))
+
+    def verify_code(self, code):
+        if not self.remote:
+            self.go(ENROLL_SUMMARY)
+            return None
+        self.notify_message("Verifying...", INFO)
+        return Request(self, "POST", "/otp/verify",
+                       {"email": self.enrollment_data.get("Email Address", ""), "code": code},
+                       lambda result: self.go(ENROLL_SUMMARY))
+
+    def enrollment_request(self):
+        # Registers the finished enrollment once the password hash is ready; sent from the
+        # summary without blocking it
+        if not self.remote or self.password_hash is None:
+            return None
+        return Request(self, "POST", "/enroll", {"username": self.enrollment_data.get("Username", ""),
+                                                 "password_hash": self.password_hash},
+                       lambda result: None)
+
+    def proceed_to_dashboard(self):
+        self._enter_dashboard(self.enrollment_data.get("Username", "User"))
+
+    def logout(self):
+        self.current_user = None
+        self.go(WELCOME)
+
+    def _enter_dashboard(self, username):
+        self.current_user = username
+        self.go(DASHBOARD)
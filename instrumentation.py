@@ -0,0 +1,151 @@
+import bisect
+import json
+import os
+import re
+import time
+from collections import deque
+from functools import wraps
+
+import customtkinter as ctk
+
+# ========== METRICS SETTINGS ==========
+METRICS_DIR_ENV = "KEYVOX_METRICS_DIR"
+HEARTBEAT_MS = 100
+EXPORT_SECONDS = 10
+ROLLING_SAMPLES = 512
+BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+SPAN_PREFIXES = ("show_", "navigate_to_")
+# CTkButton's internal click handler: _on_release in customtkinter 6, _clicked in 5.x
+CLICK_HANDLERS = ("_on_release", "_clicked")
+
+
+class Histogram:
+    # Cumulative Prometheus-style buckets plus a rolling window for recent percentiles
+    def __init__(self, buckets=BUCKETS_MS, window=ROLLING_SAMPLES):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.recent = deque(maxlen=window)
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.recent.append(value)
+
+    def percentile(self, q):
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def summary(self):
+        return {"count": self.count, "sum_ms": round(self.total, 3),
+                "p50_ms": round(self.percentile(0.5), 3), "p95_ms": round(self.percentile(0.95), 3),
+                "max_recent_ms": round(max(self.recent, default=0.0), 3)}
+
+
+class Instrumentation:
+    # Timing spans around page methods and button callbacks, plus a mainloop lag
+    # heartbeat. Nothing is wrapped or scheduled unless install() is called, so a
+    # disabled build pays nothing.
+    def __init__(self, directory):
+        self.directory = directory
+        self.histograms = {}
+        self._app = None
+        self._expected = None
+        self._last_export = time.monotonic()
+        self._click_handler = None
+        self._original_click = None
+
+    @classmethod
+    def from_env(cls):
+        directory = os.environ.get(METRICS_DIR_ENV)
+        return cls(directory) if directory else None
+
+    def observe(self, name, value_ms):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.observe(value_ms)
+
+    def span(self, name, func):
+        @wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.observe(name, (time.perf_counter() - start) * 1000)
+        return timed
+
+    def install(self, app):
+        self._app = app
+        for name in dir(type(app)):
+            if name.startswith(SPAN_PREFIXES) and callable(getattr(app, name)):
+                setattr(app, name, self.span(f"span:{name}", getattr(app, name)))
+
+        # Button commands run from CTkButton's click handler; time every click by its label
+        handler = next((name for name in CLICK_HANDLERS if hasattr(ctk.CTkButton, name)), None)
+        if handler is not None:
+            original = self._original_click = getattr(ctk.CTkButton, handler)
+            self._click_handler = handler
+            instrumentation = self
+
+            def clicked(button, event=None):
+                start = time.perf_counter()
+                try:
+                    return original(button, event)
+                finally:
+                    label = button.cget("text") or "icon"
+                    instrumentation.observe(f"button:{label}", (time.perf_counter() - start) * 1000)
+
+            setattr(ctk.CTkButton, handler, clicked)
+        self._expected = time.monotonic() + HEARTBEAT_MS / 1000
+        app.after(HEARTBEAT_MS, self._heartbeat)
+        return self
+
+    def uninstall(self):
+        if self._original_click is not None:
+            setattr(ctk.CTkButton, self._click_handler, self._original_click)
+            self._original_click = None
+        self.export()
+        self._app = None
+
+    def _heartbeat(self):
+        # Lateness of a fixed-interval after() is how long the mainloop was busy
+        if self._app is None:
+            return
+        now = time.monotonic()
+        self.observe("loop_lag", max(0.0, (now - self._expected) * 1000))
+        if now - self._last_export >= EXPORT_SECONDS:
+            self.export()
+        self._expected = time.monotonic() + HEARTBEAT_MS / 1000
+        self._app.after(HEARTBEAT_MS, self._heartbeat)
+
+    def export(self):
+        self._last_export = time.monotonic()
+        os.makedirs(self.directory, exist_ok=True)
+        snapshot = {name: h.summary() for name, h in sorted(self.histograms.items())}
+        self._write("metrics.json", json.dumps({"updated": time.time(), "metrics": snapshot}, indent=2))
+        self._write("metrics.prom", self.prometheus())
+
+    def prometheus(self):
+        lines = ["# TYPE keyvox_duration_ms histogram"]
+        for name, histogram in sorted(self.histograms.items()):
+            label = re.sub(r'["\\\n]', "_", name)
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                lines.append(f'keyvox_duration_ms_bucket{{name="{label}",le="{bound}"}} {cumulative}')
+            lines.append(f'keyvox_duration_ms_bucket{{name="{label}",le="+Inf"}} {histogram.count}')
+            lines.append(f'keyvox_duration_ms_sum{{name="{label}"}} {histogram.total:.3f}')
+            lines.append(f'keyvox_duration_ms_count{{name="{label}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+    def _write(self, filename, text):
+        path = os.path.join(self.directory, filename)
+        with open(path + ".tmp", "w") as f:
+            f.write(text)
+        os.replace(path + ".tmp", path)
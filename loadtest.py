@@ -0,0 +1,129 @@
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+
+from backend import MAX_CONNECTIONS, BackendError, HttpClient, call
+from credentials import MIN_LOG_N, SCRYPT_P, SCRYPT_R, hash_password
+from flow import DASHBOARD, ENROLL_SUMMARY, ENROLLMENT_FIELDS, AuthFlow
+from stub_server import DEFAULT_OTP, StubServer
+
+# ========== LOAD TEST SETTINGS ==========
+DEFAULT_SESSIONS = 200
+DEFAULT_CONCURRENCY = 50
+DEFAULT_CONNECTIONS = MAX_CONNECTIONS * 8
+
+
+class Stats:
+    def __init__(self):
+        self.latencies = {}
+        self.failures = []
+        self.elapsed = 0.0
+
+    def observe(self, name, value_ms):
+        self.latencies.setdefault(name, []).append(value_ms)
+
+
+async def send(http, request, stats):
+    # What the Tk bridge does for the app, minus the Tk thread: run the flow's Request
+    # and report the result back to it
+    if request is None:
+        return
+    start = time.perf_counter()
+    try:
+        result = await call(http, request.method, request.path, request.body)
+    except (BackendError, OSError, asyncio.TimeoutError) as error:
+        request.failed(error)
+    else:
+        request.done(result)
+    finally:
+        stats.observe(f"{request.method} {request.path}", (time.perf_counter() - start) * 1000)
+
+
+def expect(flow, state, session, stats):
+    if flow.state != state:
+        message = flow.message[0] if flow.message else f"ended in {flow.state}"
+        stats.failures.append(f"session {session}: expected {state}: {message}")
+        return False
+    return True
+
+
+async def session(http, index, otp, password_hash, stats):
+    # Enroll a new user through every step, log out, then log back in as that user
+    start = time.perf_counter()
+    username = f"load-{index}"
+    flow = AuthFlow(remote=True)
+    flow.get_started()
+    flow.start_enrollment()
+    flow.submit_enrollment_info(dict(zip(ENROLLMENT_FIELDS, (
+        f"Load User {index}", username, "secret", "secret", f"{username}@example.com"))))
+    flow.password_hashed(password_hash)
+    flow.finish_voice_enrollment()
+    await send(http, flow.send_code(), stats)
+    await send(http, flow.verify_code(otp), stats)
+    if not expect(flow, ENROLL_SUMMARY, index, stats):
+        return
+    await send(http, flow.enrollment_request(), stats)
+    flow.proceed_to_dashboard()
+    stats.observe("enroll session", (time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    flow.logout()
+    flow.get_started()
+    await send(http, flow.login(username, "secret"), stats)
+    if expect(flow, DASHBOARD, index, stats):
+        stats.observe("login session", (time.perf_counter() - start) * 1000)
+
+
+async def run(url, sessions, concurrency, connections, otp=DEFAULT_OTP):
+    http = HttpClient(url, max_connections=connections)
+    stats = Stats()
+    slots = asyncio.Semaphore(concurrency)
+    # Every simulated user shares one password, hashed once at the cheapest cost
+    password_hash = hash_password("secret", (2 ** MIN_LOG_N, SCRYPT_R, SCRYPT_P))
+
+    async def limited(index):
+        async with slots:
+            await session(http, index, otp, password_hash, stats)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(limited(i) for i in range(sessions)))
+    stats.elapsed = time.perf_counter() - start
+    await http.close()
+    return stats
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def report(stats, sessions):
+    completed = len(stats.latencies.get("login session", []))
+    requests = sum(len(v) for name, v in stats.latencies.items() if not name.endswith("session"))
+    print(f"{completed}/{sessions} sessions in {stats.elapsed:.2f} s: "
+          f"{completed / stats.elapsed:.1f} sessions/s, {requests / stats.elapsed:.1f} requests/s")
+    print(f"{'measurement':<20} {'count':>6} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}")
+    for name, samples in sorted(stats.latencies.items()):
+        print(f"{name:<20} {len(samples):>6} {statistics.median(samples):>9.2f} "
+              f"{percentile(samples, 0.95):>9.2f} {max(samples):>9.2f}")
+    for failure in stats.failures[:10]:
+        print(f"FAIL {failure}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Drive concurrent enroll/login sessions through the auth flow")
+    parser.add_argument("--url", help="backend to hit; defaults to an in-process stub server")
+    parser.add_argument("--sessions", type=int, default=DEFAULT_SESSIONS)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--connections", type=int, default=DEFAULT_CONNECTIONS)
+    parser.add_argument("--delay", type=float, default=0.0, help="stub server latency in seconds")
+    parser.add_argument("--otp", default=DEFAULT_OTP)
+    args = parser.parse_args()
+
+    # The in-process stub gets its own loop thread so it does not share the driver's loop
+    url = args.url or StubServer(port=0, delay=args.delay).serve_in_thread().url
+    stats = asyncio.run(run(url, args.sessions, args.concurrency, args.connections, args.otp))
+    report(stats, args.sessions)
+    sys.exit(1 if stats.failures else 0)
@@ -0,0 +1,123 @@
+import time
+import tkinter as tk
+
+import customtkinter as ctk
+import numpy as np
+
+from styles import CARD_COLOR, PINK, SUBTEXT_COLOR, resolve
+
+# ========== METER SETTINGS ==========
+WINDOW_SECONDS = 2.0
+TARGET_FPS = 30
+MAX_FPS = 60
+MIN_IDLE_MS = 8
+LEVEL_SECONDS = 0.05
+LEVEL_FLOOR_DB = -60.0
+PEAK_DECAY_DB = 1.0
+LEVEL_BAR_HEIGHT = 6
+
+
+class LevelMeter(tk.Canvas):
+    # Scrolling waveform plus level bar drawn from a shared RingBuffer. Every canvas
+    # item is created once; a frame is one min/max-per-column reduction in NumPy and
+    # a coords() call per item. Frames are paced by after() so at least MIN_IDLE_MS
+    # is always left for the mainloop, and nothing is drawn while no new samples arrive.
+    def __init__(self, master, buffer, sample_rate, width=480, height=80, fps=TARGET_FPS):
+        scale = ctk.ScalingTracker.get_widget_scaling(master)
+        self.columns = max(1, int(width * scale))
+        self.pixel_height = int(height * scale)
+        super().__init__(master, width=self.columns, height=self.pixel_height, highlightthickness=0, bd=0)
+        self.buffer = buffer
+        self.interval_ms = 1000 // min(MAX_FPS, max(1, fps))
+        self.frame_ms = 0.0
+        self._job = None
+        self._drawn_total = None
+        self._peak_db = LEVEL_FLOOR_DB
+        self.set_sample_rate(sample_rate)
+
+        # Zig-zag through each column's (max, min) so one line item draws the envelope
+        wave_height = self.pixel_height - LEVEL_BAR_HEIGHT - 2
+        self._mid = wave_height / 2
+        self._coords = np.empty((self.columns, 2, 2), dtype=np.float64)
+        self._coords[:, :, 0] = np.arange(self.columns)[:, None] + 0.5
+        self._wave = self.create_line(0, self._mid, self.columns, self._mid, width=1)
+        self._level = self.create_rectangle(0, wave_height + 2, 0, self.pixel_height, width=0)
+        self._peak = self.create_line(0, wave_height + 2, 0, self.pixel_height, width=2)
+        # Canvas items do not follow CTk's appearance mode, so recolour when it switches
+        self._apply_theme()
+        ctk.AppearanceModeTracker.add(self._apply_theme, self)
+        self.bind("<Destroy>", self._on_destroy)
+
+    def set_sample_rate(self, sample_rate):
+        # Scratch space for one window, reused every frame
+        self.per_column = max(1, int(sample_rate * WINDOW_SECONDS) // self.columns)
+        self.level_samples = max(1, int(sample_rate * LEVEL_SECONDS))
+        self._window = np.zeros(self.columns * self.per_column, dtype=np.float32)
+
+    def start(self):
+        if self._job is None:
+            self._drawn_total = None
+            self._job = self.after(0, self._frame)
+
+    def stop(self):
+        # Back to a flat line until the next start()
+        self._cancel()
+        self.coords(self._wave, 0, self._mid, self.columns, self._mid)
+        self.coords(self._level, 0, self._mid * 2 + 2, 0, self.pixel_height)
+        self.coords(self._peak, 0, self._mid * 2 + 2, 0, self.pixel_height)
+        self._peak_db = LEVEL_FLOOR_DB
+
+    def _on_destroy(self, event):
+        if event.widget is self:
+            self._cancel()
+            ctk.AppearanceModeTracker.remove(self._apply_theme)
+
+    def _cancel(self):
+        if self._job is not None:
+            self.after_cancel(self._job)
+            self._job = None
+
+    def _frame(self):
+        start = time.perf_counter()
+        buffer = self.buffer()
+        if buffer.total != self._drawn_total:
+            self._drawn_total = buffer.total
+            self._draw(buffer)
+        self.frame_ms = (time.perf_counter() - start) * 1000
+        delay = max(MIN_IDLE_MS, self.interval_ms - int(self.frame_ms))
+        self._job = self.after(delay, self._frame)
+
+    def _draw(self, buffer):
+        window = self._window
+        count = min(buffer.total, buffer.capacity, len(window))
+        window[:len(window) - count] = 0.0
+        if count:
+            window[len(window) - count:] = buffer.latest(count)
+
+        columns = window.reshape(self.columns, self.per_column)
+        coords = self._coords
+        coords[:, 0, 1] = columns.max(axis=1)
+        coords[:, 1, 1] = columns.min(axis=1)
+        coords[1::2] = coords[1::2, ::-1]
+        np.clip(coords[:, :, 1], -1.0, 1.0, out=coords[:, :, 1])
+        coords[:, :, 1] *= -self._mid
+        coords[:, :, 1] += self._mid
+        self.coords(self._wave, coords.ravel().tolist())
+
+        recent = window[len(window) - self.level_samples:]
+        rms = float(np.sqrt(np.dot(recent, recent) / len(recent)))
+        level_db = float(20 * np.log10(max(rms, 1e-6)))
+        self._peak_db = max(level_db, self._peak_db - PEAK_DECAY_DB)
+        top = self._mid * 2 + 2
+        self.coords(self._level, 0, top, self._fraction(level_db) * self.columns, self.pixel_height)
+        peak_x = self._fraction(self._peak_db) * self.columns
+        self.coords(self._peak, peak_x, top, peak_x, self.pixel_height)
+
+    def _fraction(self, db):
+        return min(1.0, max(0.0, (db - LEVEL_FLOOR_DB) / -LEVEL_FLOOR_DB))
+
+    def _apply_theme(self, mode=None):
+        self.configure(bg=resolve(CARD_COLOR))
+        self.itemconfigure(self._wave, fill=resolve(PINK))
+        self.itemconfigure(self._level, fill=resolve(SUBTEXT_COLOR))
+        self.itemconfigure(self._peak, fill=resolve(PINK))
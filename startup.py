@@ -0,0 +1,120 @@
+import argparse
+import json
+import os
+import statistics
+import time
+from collections import deque
+
+# ========== STARTUP SETTINGS ==========
+STARTUP_REPORT_ENV = "KEYVOX_STARTUP_REPORT"
+MARKS = ("imports", "first_frame", "interactive", "prewarmed")
+
+
+def process_started():
+    # perf_counter() value at process creation, so interpreter start-up is included.
+    # Linux only; elsewhere falls back to when this module was imported.
+    try:
+        with open("/proc/self/stat") as f:
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return time.perf_counter()
+    return time.perf_counter() - (uptime - start_ticks / os.sysconf("SC_CLK_TCK"))
+
+
+PROCESS_STARTED = process_started()
+
+
+class StartupReport:
+    # Milliseconds from process start to each startup milestone, plus the cost of each
+    # prewarm task. With KEYVOX_STARTUP_REPORT set, every launch appends one JSON line
+    # to that file; `python startup.py FILE` summarises them per version.
+    def __init__(self, version, path=None, started=PROCESS_STARTED):
+        self.version = version
+        self.path = path
+        self.started = started
+        self.marks = {}
+        self.tasks = {}
+        self.exported = False
+
+    @classmethod
+    def from_env(cls, version):
+        return cls(version, os.environ.get(STARTUP_REPORT_ENV))
+
+    def mark(self, name):
+        if name not in self.marks:
+            self.marks[name] = (time.perf_counter() - self.started) * 1000
+
+    def summary(self):
+        return {"version": self.version, "at": time.time(),
+                "marks_ms": {name: round(ms, 1) for name, ms in self.marks.items()},
+                "tasks_ms": {name: round(ms, 1) for name, ms in self.tasks.items()}}
+
+    def export(self):
+        if self.exported:
+            return
+        self.exported = True
+        if self.path:
+            with open(self.path, "a") as f:
+                f.write(json.dumps(self.summary()) + "\n")
+
+
+class Prewarmer:
+    # Runs queued (name, task) pairs one per Tk idle pass. Tk handles pending input
+    # and redraws before the next idle callback, so a click waits for at most one
+    # task. Task times go to the report; on_drained runs whenever the queue empties.
+    def __init__(self, widget, report=None, on_drained=None):
+        self.widget = widget
+        self.report = report
+        self.on_drained = on_drained
+        self._tasks = deque()
+        self._job = None
+
+    def add(self, tasks):
+        self._tasks.extend(tasks)
+        if self._job is None and self._tasks:
+            self._job = self.widget.after_idle(self._step)
+
+    def cancel(self):
+        self._tasks.clear()
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
+
+    def _step(self):
+        self._job = None
+        name, task = self._tasks.popleft()
+        start = time.perf_counter()
+        try:
+            task()
+        except Exception as e:
+            print(f"Prewarm error ({name}): {e}")
+        if self.report is not None:
+            self.report.tasks[name] = (time.perf_counter() - start) * 1000
+        if self._tasks:
+            self._job = self.widget.after_idle(self._step)
+        elif self.on_drained:
+            self.on_drained()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarise startup reports across releases")
+    parser.add_argument("report", nargs="?", default=os.environ.get(STARTUP_REPORT_ENV))
+    args = parser.parse_args()
+    if not args.report:
+        parser.error(f"pass a report file or set {STARTUP_REPORT_ENV}")
+
+    runs = {}
+    with open(args.report) as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                runs.setdefault(record["version"], []).append(record["marks_ms"])
+
+    print(f"{'version':<12} {'runs':>5} " + " ".join(f"{mark:>12}" for mark in MARKS) + "   (median ms)")
+    for version, marks in runs.items():
+        medians = [statistics.median(m[mark] for m in marks if mark in m) if any(mark in m for m in marks)
+                   else None for mark in MARKS]
+        print(f"{version:<12} {len(marks):>5} "
+              + " ".join(f"{value:>12.1f}" if value is not None else f"{'-':>12}" for value in medians))
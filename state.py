@@ -0,0 +1,87 @@
+import time
+
+# ========== STATE SETTINGS ==========
+TICK_MS = 1000
+
+
+class StateStore:
+    # Observable key/value state with bindings from keys to widget options. set()
+    # only records what changed; every change made before Tk goes idle is flushed
+    # in one pass that recomputes each affected binding once, drops values equal
+    # to what the widget already shows, and merges the rest into a single
+    # configure() per widget. Bindings of destroyed widgets are pruned on flush.
+    def __init__(self, widget, **values):
+        self.widget = widget
+        self.values = dict(values)
+        self.flushes = 0
+        self.configures = 0
+        self._bindings = {}
+        self._dirty = set()
+        self._flush_job = None
+        self._tick_job = None
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def set(self, key, value):
+        self.update({key: value})
+
+    def update(self, values):
+        for key, value in values.items():
+            if key in self.values and self.values[key] == value:
+                continue
+            self.values[key] = value
+            self._dirty.add(key)
+        if self._dirty and self._flush_job is None:
+            self._flush_job = self.widget.after_idle(self.flush)
+
+    def bind(self, keys, widget, option="text", format=str):
+        # keys is one key or a tuple of keys; format gets their values in that order.
+        # Applied immediately so a freshly built widget never shows a stale value.
+        keys = (keys,) if isinstance(keys, str) else tuple(keys)
+        binding = [widget, option, keys, format, self._compute(keys, format)]
+        widget.configure(**{option: binding[4]})
+        for key in keys:
+            # Pages are rebuilt on every login, so drop bindings left by destroyed widgets
+            live = [other for other in self._bindings.get(key, ()) if other[0].winfo_exists()]
+            self._bindings[key] = live + [binding]
+        return widget
+
+    def flush(self):
+        self._flush_job = None
+        dirty, self._dirty = self._dirty, set()
+        pending = {}
+        seen = set()
+        for key in dirty:
+            bindings = self._bindings.get(key)
+            if not bindings:
+                continue
+            live = [binding for binding in bindings if binding[0].winfo_exists()]
+            self._bindings[key] = live
+            for binding in live:
+                if id(binding) in seen:
+                    continue
+                seen.add(id(binding))
+                value = self._compute(binding[2], binding[3])
+                if value == binding[4]:
+                    continue
+                binding[4] = value
+                pending.setdefault(binding[0], {})[binding[1]] = value
+        for widget, options in pending.items():
+            widget.configure(**options)
+        self.flushes += 1
+        self.configures += len(pending)
+
+    def start_clock(self, key="now", interval_ms=TICK_MS):
+        # Whole seconds in `key`, for bindings that render relative times
+        self.set(key, int(time.time()))
+        self._tick_job = self.widget.after(interval_ms, self.start_clock, key, interval_ms)
+
+    def stop(self):
+        for job in (self._flush_job, self._tick_job):
+            if job is not None:
+                self.widget.after_cancel(job)
+        self._flush_job = self._tick_job = None
+
+    def _compute(self, keys, format):
+        return format(*(self.values.get(key) for key in keys))
@@ -0,0 +1,253 @@
+import argparse
+import mmap
+import os
+import sqlite3
+import struct
+import time
+
+import numpy as np
+
+from voiceprint import VOICEPRINT_DIM
+
+# ========== STORE SETTINGS ==========
+DATA_DIR_ENV = "KEYVOX_DATA_DIR"
+DEFAULT_DATA_DIR = os.path.join(os.path.expanduser("~"), ".keyvox")
+DATABASE_NAME = "enrollments.db"
+VOICEPRINTS_NAME = "voiceprints.bin"
+VOICEPRINTS_MAGIC = b"KVXV1"
+HEADER_BYTES = 64
+INITIAL_SLOTS = 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    username      TEXT PRIMARY KEY,
+    full_name     TEXT NOT NULL DEFAULT '',
+    email         TEXT NOT NULL DEFAULT '',
+    password_hash TEXT,
+    slot          INTEGER UNIQUE,
+    enrolled_at   REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS access_log (
+    id       INTEGER PRIMARY KEY,
+    username TEXT NOT NULL,
+    at       REAL NOT NULL,
+    event    TEXT NOT NULL,
+    token_id TEXT
+);
+CREATE INDEX IF NOT EXISTS access_log_by_user ON access_log (username, id);
+"""
+
+
+class VoiceprintFile:
+    # Fixed-stride float32 rows behind a small header, memory-mapped read/write.
+    # Row i lives at HEADER_BYTES + i * stride, so loading is a single np.frombuffer
+    # over the mapping with no per-record parsing. The file doubles when it fills.
+    def __init__(self, path, dim=VOICEPRINT_DIM):
+        self.path = path
+        self.dim = dim
+        self.stride = dim * 4
+        new = not os.path.exists(path) or os.path.getsize(path) <= HEADER_BYTES
+        self._file = open(path, "r+b" if not new else "w+b")
+        if new:
+            header = VOICEPRINTS_MAGIC + struct.pack("<I", dim)
+            self._file.write(header.ljust(HEADER_BYTES, b"\0"))
+            self._file.truncate(HEADER_BYTES + INITIAL_SLOTS * self.stride)
+            self._file.flush()
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        if self._map[:len(VOICEPRINTS_MAGIC)] != VOICEPRINTS_MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a KeyVox voiceprint file")
+        (stored_dim,) = struct.unpack_from("<I", self._map, len(VOICEPRINTS_MAGIC))
+        if stored_dim != dim:
+            self.close()
+            raise ValueError(f"{path} holds {stored_dim}-dimensional voiceprints, expected {dim}")
+        self._rows = self._view()
+
+    @property
+    def capacity(self):
+        return len(self._rows)
+
+    def _view(self):
+        count = (len(self._map) - HEADER_BYTES) // self.stride
+        return np.frombuffer(self._map, dtype=np.float32, count=count * self.dim,
+                             offset=HEADER_BYTES).reshape(count, self.dim)
+
+    def rows(self, slots):
+        # Copies the requested rows out of the mapping in one fancy-indexing pass
+        return self._rows[np.asarray(slots, dtype=np.int64)]
+
+    def write(self, slot, vector):
+        while slot >= self.capacity:
+            self._grow()
+        self._rows[slot] = vector
+
+    def flush(self):
+        self._map.flush()
+
+    def _grow(self):
+        # A header-only file maps to zero rows, and doubling zero never makes room
+        capacity = max(INITIAL_SLOTS, 2 * self.capacity)
+        del self._rows
+        self._map.close()
+        self._file.truncate(HEADER_BYTES + capacity * self.stride)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self._rows = self._view()
+
+    def close(self):
+        self._rows = None
+        self._map.close()
+        self._file.close()
+
+
+class EnrollmentStore:
+    # Enrollment metadata in SQLite (WAL, so reads never wait on a commit) plus
+    # voiceprints in a VoiceprintFile, addressed by each user's `slot`.
+    #
+    # save() only queues; commit() writes the whole batch. Voiceprints go into slots
+    # no committed row points at and are flushed before the single SQLite transaction
+    # that points users at them, so a crash leaves either the old or the new enrollment,
+    # never a mix. Slots orphaned that way are simply reused.
+    def __init__(self, directory, dim=VOICEPRINT_DIM):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.db = sqlite3.connect(os.path.join(directory, DATABASE_NAME))
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+        self.voiceprints_file = VoiceprintFile(os.path.join(directory, VOICEPRINTS_NAME), dim)
+        # username -> slot for every stored voiceprint, read once and kept in step with commits
+        self.slots = dict(self.db.execute("SELECT username, slot FROM users WHERE slot IS NOT NULL"))
+        used = np.zeros(max(self.slots.values(), default=-1) + 1, dtype=bool)
+        used[list(self.slots.values())] = True
+        self._next_slot = len(used)
+        self._free = np.flatnonzero(~used)[::-1].tolist()
+        self._pending = {}
+
+    @classmethod
+    def open(cls, directory=None):
+        return cls(directory or os.environ.get(DATA_DIR_ENV) or DEFAULT_DATA_DIR)
+
+    def save(self, username, full_name="", email="", password_hash=None, voiceprint=None):
+        self._pending[username] = (full_name, email, password_hash, voiceprint)
+
+    def commit(self):
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, {}
+        slots = {}
+        for username, (_, _, _, voiceprint) in batch.items():
+            if voiceprint is not None:
+                slots[username] = self._take_slot()
+                self.voiceprints_file.write(slots[username], voiceprint)
+        self.voiceprints_file.flush()
+
+        now = time.time()
+        with self.db:
+            self.db.executemany("INSERT OR REPLACE INTO users VALUES (?, ?, ?, ?, ?, ?)",
+                                [(username, full_name, email, password_hash, slots.get(username), now)
+                                 for username, (full_name, email, password_hash, _) in batch.items()])
+        for username in batch:
+            replaced = self.slots.pop(username, None)
+            if replaced is not None:
+                self._free.append(replaced)
+        self.slots.update(slots)
+
+    def delete(self, username):
+        with self.db:
+            deleted = self.db.execute("DELETE FROM users WHERE username = ?", (username,)).rowcount
+        slot = self.slots.pop(username, None)
+        if slot is not None:
+            self._free.append(slot)
+        return bool(deleted)
+
+    def profile(self, username):
+        row = self.db.execute("SELECT username, full_name, email, enrolled_at FROM users WHERE username = ?",
+                              (username,)).fetchone()
+        if row is None:
+            return None
+        return {"username": row[0], "full_name": row[1], "email": row[2], "enrolled_at": row[3]}
+
+    def set_password_hash(self, username, password_hash):
+        with self.db:
+            self.db.execute("UPDATE users SET password_hash = ? WHERE username = ?", (password_hash, username))
+
+    def password_hash(self, username):
+        row = self.db.execute("SELECT password_hash FROM users WHERE username = ?", (username,)).fetchone()
+        return row[0] if row else None
+
+    def log_access(self, username, event, token_id=None):
+        with self.db:
+            self.db.execute("INSERT INTO access_log (username, at, event, token_id) VALUES (?, ?, ?, ?)",
+                            (username, time.time(), event, token_id))
+
+    def access_count(self, username):
+        return self.db.execute("SELECT COUNT(*) FROM access_log WHERE username = ?", (username,)).fetchone()[0]
+
+    def access_page(self, username, offset, limit):
+        # Rows offset .. offset + limit of the history, newest first, as (at, event, token_id).
+        # The skipped rows are stepped over inside access_log_by_user without being read,
+        # so a reader can jump straight to any page.
+        return self.db.execute(
+            "SELECT at, event, token_id FROM access_log WHERE username = ? "
+            "ORDER BY id DESC LIMIT ? OFFSET ?", (username, limit, offset)).fetchall()
+
+    def voiceprints(self):
+        # (usernames, float32 matrix) of every stored voiceprint, read straight off the mapping
+        usernames = list(self.slots)
+        return usernames, self.voiceprints_file.rows(list(self.slots.values()))
+
+    def __len__(self):
+        return self.db.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+
+    def close(self):
+        self.commit()
+        self.db.close()
+        self.voiceprints_file.close()
+
+    def _take_slot(self):
+        if self._free:
+            return self._free.pop()
+        self._next_slot += 1
+        return self._next_slot - 1
+
+
+# =========================================================
+# BENCHMARK
+# =========================================================
+def benchmark(directory, users=50000, batch=1000, seed=0):
+    from voice_index import VoiceIndex
+    from voiceprint import normalize
+
+    rng = np.random.default_rng(seed)
+    store = EnrollmentStore(directory)
+    start = time.perf_counter()
+    for offset in range(0, users, batch):
+        vectors = normalize(rng.standard_normal((min(batch, users - offset), VOICEPRINT_DIM)).astype(np.float32))
+        for i, vector in enumerate(vectors):
+            store.save(f"user-{offset + i}", f"User {offset + i}", f"user{offset + i}@example.com", None, vector)
+        store.commit()
+    write = time.perf_counter() - start
+    store.close()
+
+    start = time.perf_counter()
+    store = EnrollmentStore(directory)
+    usernames, vectors = store.voiceprints()
+    index = VoiceIndex(capacity=len(usernames), approximate=True)
+    index.load(usernames, vectors)
+    load = time.perf_counter() - start
+    store.close()
+    return write, load, len(index)
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    parser = argparse.ArgumentParser(description="Time batched enrollment writes and startup load")
+    parser.add_argument("--users", type=int, default=50000)
+    parser.add_argument("--batch", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        write, load, count = benchmark(directory, args.users, args.batch)
+    print(f"write {args.users} users in batches of {args.batch}: {write:.2f} s")
+    print(f"open store + load {count} voiceprints into the index: {load * 1000:.1f} ms")
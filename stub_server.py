@@ -0,0 +1,157 @@
+import argparse
+import asyncio
+import json
+import threading
+
+from credentials import verify_password
+
+# ========== STUB SETTINGS ==========
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_OTP = "123456"
+
+
+class StubServer:
+    # Local stand-in for the KeyVox backend: keep-alive HTTP/1.1 with JSON bodies and
+    # in-memory state. `delay` adds latency to every response for responsiveness tests;
+    # `idle_timeout` silently drops keep-alive connections idle that long, as real servers do.
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, delay=0.0, otp=DEFAULT_OTP, idle_timeout=None):
+        self.host = host
+        self.port = port
+        self.delay = delay
+        self.otp = otp
+        self.idle_timeout = idle_timeout
+        self.users = {}
+        self.sent_codes = {}
+        self.requests = 0
+        self.connections = 0
+        self._server = None
+        self.routes = {
+            ("POST", "/login"): self.login,
+            ("POST", "/enroll"): self.enroll,
+            ("POST", "/otp/send"): self.send_code,
+            ("POST", "/otp/verify"): self.verify_code,
+            ("GET", "/health"): self.health,
+        }
+
+    # --- Handlers: (status, body) ---
+    def health(self, body):
+        return 200, {"ok": True}
+
+    async def login(self, body):
+        username, password = body.get("username"), body.get("password")
+        if not username or not password:
+            return 400, {"error": "Please enter both username and password."}
+        known = self.users.get(username)
+        if known is not None:
+            # scrypt is deliberately slow; keep it off the server loop
+            matched = await asyncio.get_running_loop().run_in_executor(None, verify_password, password, known)
+            if not matched:
+                return 401, {"error": "Invalid username or password."}
+        return 200, {"username": username}
+
+    def enroll(self, body):
+        username = body.get("username")
+        if not username:
+            return 400, {"error": "Username is required."}
+        if not body.get("password_hash"):
+            return 400, {"error": "Password hash is required."}
+        self.users[username] = body["password_hash"]
+        return 200, {"username": username}
+
+    def send_code(self, body):
+        email = body.get("email")
+        if not email:
+            return 400, {"error": "Email address is required."}
+        self.sent_codes[email] = self.otp
+        return 200, {"sent": True}
+
+    def verify_code(self, body):
+        code = self.sent_codes.get(body.get("email"))
+        if code is None or body.get("code") != code:
+            return 400, {"error": "Invalid verification code."}
+        return 200, {"verified": True}
+
+    # --- Transport ---
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    def serve_in_thread(self):
+        # Starts the server on its own loop thread and returns once it is listening
+        ready = threading.Event()
+        loop = asyncio.new_event_loop()
+
+        def run():
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(self.start())
+            ready.set()
+            loop.run_forever()
+
+        threading.Thread(target=run, name="keyvox-stub", daemon=True).start()
+        ready.wait()
+        self.url = f"http://{self.host}:{self.port}"
+        return self
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                request_line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                if not request_line:
+                    break
+                method, path, _version = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                raw = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                self.requests += 1
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+                status, body = await self._dispatch(method, path, raw)
+                payload = json.dumps(body).encode()
+                writer.write((f"HTTP/1.1 {status} {'OK' if status < 300 else 'Error'}\r\n"
+                              f"Content-Type: application/json\r\n"
+                              f"Content-Length: {len(payload)}\r\n"
+                              f"Connection: keep-alive\r\n\r\n").encode() + payload)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method, path, raw):
+        handler = self.routes.get((method, path))
+        if handler is None:
+            return 404, {"error": f"No route for {method} {path}"}
+        try:
+            body = json.loads(raw) if raw else {}
+        except ValueError:
+            return 400, {"error": "Malformed JSON body."}
+        result = handler(body)
+        return await result if asyncio.iscoroutine(result) else result
+
+
+async def serve(host, port, delay):
+    server = await StubServer(host, port, delay).start()
+    print(f"KeyVox stub backend on http://{host}:{server.port}")
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in for the KeyVox backend")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds of latency per response")
+    args = parser.parse_args()
+    asyncio.run(serve(args.host, args.port, args.delay))
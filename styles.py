@@ -0,0 +1,80 @@
+import customtkinter as ctk
+
+# ========== COLOUR TOKENS ==========
+# (light, dark) pairs; CTk re-skins every widget in place on an appearance change
+PINK = ("#e75480", "#e75480")
+LIGHT_PINK = ("#f7a1b1", "#f28ca0")
+LINK_COLOR = ("#e75480", "#f28ca0")
+BG_COLOR = ("#f5f5f5", "#1a1a1a")
+CARD_COLOR = ("#ffffff", "#2b2b2b")
+TEXT_COLOR = ("#333333", "white")
+SUBTEXT_COLOR = ("#666666", "gray80")
+MUTED_COLOR = ("#666666", "gray60")
+HOVER_COLOR = ("#ececec", "#2e2e2e")
+BUTTON_TEXT_COLOR = ("white", "white")
+ERROR_COLOR = ("red", "red")
+
+THEMES = ("light", "dark")
+
+# ========== FONT TOKENS ==========
+# token: (size, weight) at scale 1.0
+FONT_TOKENS = {
+    "brand": (36, "bold"),
+    "hero": (34, "bold"),
+    "title": (28, "bold"),
+    "heading": (26, "bold"),
+    "section": (24, "bold"),
+    "button_lg": (18, "bold"),
+    "card_title": (18, "bold"),
+    "button": (16, "bold"),
+    "body_lg": (16, "normal"),
+    "nav": (16, "normal"),
+    "label": (14, "bold"),
+    "body": (14, "normal"),
+    "caption": (12, "normal"),
+}
+
+
+def resolve(color):
+    # Plain colour string for the current theme, for non-CTk consumers such as Canvas
+    if isinstance(color, (tuple, list)):
+        return color[0] if ctk.get_appearance_mode() == "Light" else color[1]
+    return color
+
+
+class Styles:
+    # Hands out one shared CTkFont per token. Fonts are created lazily because
+    # they need a Tk root, and set_scale resizes every live font in place.
+    # set_theme switches the palette for every existing widget in one pass.
+    def __init__(self, scale=1.0, theme="dark"):
+        self.scale = scale
+        self.theme = None
+        self._fonts = {}
+        self.set_theme(theme)
+
+    def set_theme(self, theme):
+        if theme not in THEMES:
+            raise ValueError(f"Unknown theme: {theme}")
+        if theme != self.theme:
+            self.theme = theme
+            ctk.set_appearance_mode(theme)
+
+    def toggle_theme(self):
+        self.set_theme("light" if self.theme == "dark" else "dark")
+        return self.theme
+
+    def font(self, token):
+        font = self._fonts.get(token)
+        if font is None:
+            size, weight = FONT_TOKENS[token]
+            font = ctk.CTkFont(size=self._scaled(size), weight=weight)
+            self._fonts[token] = font
+        return font
+
+    def set_scale(self, scale):
+        self.scale = scale
+        for token, font in self._fonts.items():
+            font.configure(size=self._scaled(FONT_TOKENS[token][0]))
+
+    def _scaled(self, size):
+        return max(1, round(size * self.scale))
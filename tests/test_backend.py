@@ -0,0 +1,119 @@
+import asyncio
+import time
+
+import pytest
+
+from backend import BackendError, HttpClient, call
+from stub_server import StubServer
+
+
+@pytest.fixture
+def server():
+    return StubServer(port=0).serve_in_thread()
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_call_returns_json(server):
+    async def scenario():
+        http = HttpClient(server.url)
+        try:
+            return await call(http, "GET", "/health")
+        finally:
+            await http.close()
+
+    assert run(scenario()) == {"ok": True}
+
+
+def test_call_raises_server_error(server):
+    async def scenario():
+        http = HttpClient(server.url)
+        try:
+            with pytest.raises(BackendError) as error:
+                await call(http, "POST", "/login", {"username": "alice"})
+            return error.value
+        finally:
+            await http.close()
+
+    error = run(scenario())
+    assert error.status == 400
+    assert str(error) == "Please enter both username and password."
+
+
+def test_keep_alive_reuses_connection(server):
+    async def scenario():
+        http = HttpClient(server.url)
+        try:
+            for _ in range(5):
+                await call(http, "GET", "/health")
+            return len(http._idle)
+        finally:
+            await http.close()
+
+    assert run(scenario()) == 1
+    assert server.requests == 5
+    assert server.connections == 1
+
+
+def test_retries_after_server_closed_idle_connection():
+    server = StubServer(port=0, idle_timeout=0.05).serve_in_thread()
+
+    async def scenario():
+        http = HttpClient(server.url)
+        try:
+            await call(http, "GET", "/health")
+            await asyncio.sleep(0.2)
+            return await call(http, "GET", "/health")
+        finally:
+            await http.close()
+
+    assert run(scenario()) == {"ok": True}
+    assert server.connections == 2
+
+
+def test_timeout_discards_connection():
+    server = StubServer(port=0, delay=0.5).serve_in_thread()
+
+    async def scenario():
+        http = HttpClient(server.url)
+        try:
+            start = time.perf_counter()
+            with pytest.raises(asyncio.TimeoutError):
+                await http.request("GET", "/health", timeout=0.05)
+            elapsed = time.perf_counter() - start
+            # The half-read connection must not go back to the pool
+            idle = len(http._idle)
+            server.delay = 0.0
+            return elapsed, idle, await call(http, "GET", "/health")
+        finally:
+            await http.close()
+
+    elapsed, idle, result = run(scenario())
+    assert elapsed < 0.4
+    assert idle == 0
+    assert result == {"ok": True}
+
+
+def test_cancellation_releases_connection_slot():
+    server = StubServer(port=0, delay=0.5).serve_in_thread()
+
+    async def scenario():
+        http = HttpClient(server.url, max_connections=1)
+        try:
+            task = asyncio.create_task(http.request("GET", "/health"))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            idle = len(http._idle)
+            server.delay = 0.0
+            # With one slot, this only completes if the cancelled request gave it back
+            return idle, await asyncio.wait_for(call(http, "GET", "/health"), 1.0)
+        finally:
+            await http.close()
+
+    idle, result = run(scenario())
+    assert idle == 0
+    assert result == {"ok": True}
@@ -0,0 +1,100 @@
+import struct
+
+import numpy as np
+import pytest
+
+from store import HEADER_BYTES, INITIAL_SLOTS, VOICEPRINTS_MAGIC, EnrollmentStore, VoiceprintFile
+from voiceprint import VOICEPRINT_DIM, normalize
+
+
+def voiceprint(rng):
+    return normalize(rng.standard_normal(VOICEPRINT_DIM).astype(np.float32))
+
+
+def stored(store):
+    usernames, vectors = store.voiceprints()
+    return dict(zip(usernames, vectors))
+
+
+def check_matches(store, expected):
+    assert set(store.slots) == set(expected)
+    assert len(set(store.slots.values())) == len(store.slots)
+    vectors = stored(store)
+    for username, vector in expected.items():
+        np.testing.assert_array_equal(vectors[username], vector)
+
+
+def test_reenroll_and_delete_survive_reopen(tmp_path):
+    rng = np.random.default_rng(0)
+    expected = {}
+    store = EnrollmentStore(str(tmp_path))
+    for i in range(20):
+        expected[f"user-{i}"] = voiceprint(rng)
+        store.save(f"user-{i}", voiceprint=expected[f"user-{i}"])
+    store.commit()
+
+    for i in range(0, 20, 2):
+        expected[f"user-{i}"] = voiceprint(rng)
+        store.save(f"user-{i}", voiceprint=expected[f"user-{i}"])
+    store.commit()
+    for i in range(0, 20, 5):
+        assert store.delete(f"user-{i}")
+        del expected[f"user-{i}"]
+    check_matches(store, expected)
+    store.close()
+
+    store = EnrollmentStore(str(tmp_path))
+    check_matches(store, expected)
+    # Slots freed by re-enrollments and deletes are handed out again without clobbering anyone
+    for i in range(20, 30):
+        expected[f"user-{i}"] = voiceprint(rng)
+        store.save(f"user-{i}", voiceprint=expected[f"user-{i}"])
+    store.commit()
+    check_matches(store, expected)
+    store.close()
+
+    store = EnrollmentStore(str(tmp_path))
+    check_matches(store, expected)
+    store.close()
+
+
+def test_grows_past_the_initial_slots(tmp_path):
+    rng = np.random.default_rng(1)
+    path = str(tmp_path / "voiceprints.bin")
+    vectors = VoiceprintFile(path)
+    vector = voiceprint(rng)
+    vectors.write(INITIAL_SLOTS + 5, vector)
+    assert vectors.capacity >= INITIAL_SLOTS + 6
+    vectors.close()
+
+    vectors = VoiceprintFile(path)
+    np.testing.assert_array_equal(vectors.rows([INITIAL_SLOTS + 5])[0], vector)
+    vectors.close()
+
+
+@pytest.mark.parametrize("size", [0, HEADER_BYTES])
+def test_header_only_file_is_treated_as_new(tmp_path, size):
+    path = str(tmp_path / "voiceprints.bin")
+    header = VOICEPRINTS_MAGIC + struct.pack("<I", VOICEPRINT_DIM)
+    with open(path, "wb") as f:
+        f.write(header.ljust(HEADER_BYTES, b"\0")[:size])
+    vectors = VoiceprintFile(path)
+    vector = voiceprint(np.random.default_rng(2))
+    vectors.write(0, vector)
+    np.testing.assert_array_equal(vectors.rows([0])[0], vector)
+    vectors.close()
+
+
+def test_access_pages_jump_to_any_offset(tmp_path):
+    store = EnrollmentStore(str(tmp_path))
+    for i in range(25):
+        store.log_access("alice", f"login {i}")
+        store.log_access("bob", f"login {i}")
+    assert store.access_count("alice") == 25
+
+    events = [row[1] for row in store.access_page("alice", 20, 10)]
+    assert events == [f"login {i}" for i in range(4, -1, -1)]
+    pages = [row for offset in range(0, 25, 10) for row in store.access_page("alice", offset, 10)]
+    assert [row[1] for row in pages] == [f"login {i}" for i in range(24, -1, -1)]
+    assert store.access_page("alice", 25, 10) == []
+    store.close()
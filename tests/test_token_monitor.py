@@ -0,0 +1,128 @@
+import os
+import queue
+
+import pytest
+
+import token_monitor
+from token_monitor import TokenMonitor
+
+
+@pytest.fixture
+def monitors():
+    started = []
+    yield started
+    for monitor in started:
+        monitor.stop()
+
+
+def start(monitors, directory, **kwargs):
+    monitor = TokenMonitor(directory=str(directory), pattern="usb-*", **kwargs)
+    monitors.append(monitor.start())
+    return monitor
+
+
+def next_change(monitor, timeout=2.0):
+    try:
+        return monitor.changes.get(timeout=timeout)
+    except queue.Empty:
+        pytest.fail("no token change reported")
+
+
+def test_reports_insert_and_remove(tmp_path, monitors):
+    monitor = start(monitors, tmp_path)
+    assert monitor.state["present"] is False
+
+    (tmp_path / "usb-KeyVox_Token_1234").touch()
+    changed = next_change(monitor)
+    assert changed["present"] is True
+    assert changed["token_id"] == "usb-KeyVox_Token_1234"
+    assert changed["last_sync"] is not None
+
+    os.remove(tmp_path / "usb-KeyVox_Token_1234")
+    assert next_change(monitor) == {"present": False, "token_id": None}
+    assert monitor.state["present"] is False
+
+
+def test_ignores_devices_outside_pattern(tmp_path, monitors):
+    monitor = start(monitors, tmp_path)
+    (tmp_path / "ata-Some_Disk").touch()
+    (tmp_path / "usb-KeyVox_Token_1234").touch()
+    assert next_change(monitor)["token_id"] == "usb-KeyVox_Token_1234"
+    assert monitor.changes.empty()
+
+
+def test_starts_with_token_already_present(tmp_path, monitors):
+    (tmp_path / "usb-KeyVox_Token_1234").touch()
+    monitor = start(monitors, tmp_path)
+    assert monitor.state["present"] is True
+    assert monitor.state["token_id"] == "usb-KeyVox_Token_1234"
+
+
+def test_missing_directory_is_picked_up_when_created(tmp_path, monitors, monkeypatch):
+    monkeypatch.setattr(token_monitor, "FALLBACK_POLL_SECONDS", 0.05)
+    directory = tmp_path / "by-id"
+    monitor = start(monitors, directory)
+    assert monitor.state["present"] is False
+
+    directory.mkdir()
+    (directory / "usb-KeyVox_Token_1234").touch()
+    assert next_change(monitor)["present"] is True
+
+    # Once the directory exists the monitor is back on inotify and sees removals too
+    os.remove(directory / "usb-KeyVox_Token_1234")
+    assert next_change(monitor)["present"] is False
+
+
+class FakeWidget:
+    # Stands in for a Tk widget without file handlers, as on Windows
+    def __init__(self):
+        self.tk = object()
+        self.jobs = []
+
+    def after(self, ms, callback):
+        self.jobs.append(callback)
+        return len(self.jobs)
+
+    def after_cancel(self, job):
+        pass
+
+    def run_pending(self):
+        jobs, self.jobs = self.jobs, []
+        for callback in jobs:
+            callback()
+
+
+def test_rescans_from_tk_without_inotify(tmp_path, monitors, monkeypatch):
+    monkeypatch.setattr(token_monitor, "_inotify", lambda: None)
+    monitor = start(monitors, tmp_path)
+    assert not monitor.watching
+
+    widget, seen = FakeWidget(), []
+    monitor.attach(widget, seen.append)
+    (tmp_path / "usb-KeyVox_Token_1234").touch()
+    widget.run_pending()
+    assert seen[-1]["token_id"] == "usb-KeyVox_Token_1234"
+
+    os.remove(tmp_path / "usb-KeyVox_Token_1234")
+    widget.run_pending()
+    assert seen[-1] == {"present": False, "token_id": None}
+    assert len(widget.jobs) == 1
+
+
+def test_takes_over_when_the_worker_dies(tmp_path, monitors, monkeypatch):
+    monitor = start(monitors, tmp_path)
+    assert monitor.watching
+    widget, seen = FakeWidget(), []
+    monitor.attach(widget, seen.append)
+
+    def broken(fd):
+        raise OSError("watch failed")
+
+    monkeypatch.setattr(monitor, "_watch", broken)
+    monitor._stop_w.send(b"x")  # ends the current _watch; the next one fails
+    monitor._thread.join(timeout=2)
+    assert not monitor.watching
+
+    (tmp_path / "usb-KeyVox_Token_1234").touch()
+    widget.run_pending()
+    assert seen[-1]["present"] is True
@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+
+import voice_index
+from voice_index import VoiceIndex
+from voiceprint import VOICEPRINT_DIM, normalize
+
+
+@pytest.fixture
+def small_partitions(monkeypatch):
+    # Partition at a few hundred users instead of tens of thousands
+    monkeypatch.setattr(voice_index, "APPROX_MIN_SIZE", 200)
+    monkeypatch.setattr(voice_index, "APPROX_LIST_SIZE", 20)
+
+
+def voiceprints(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return normalize(rng.standard_normal((count, VOICEPRINT_DIM)).astype(np.float32))
+
+
+def check_bookkeeping(index):
+    # Every row sits in exactly the partition slot its _lists/_slots entries point at
+    assert sorted(index._rows.values()) == list(range(len(index)))
+    if index._centroids is None:
+        return
+    listed = []
+    for list_id, partition in enumerate(index._partitions):
+        for slot in range(partition.size):
+            row = int(partition.rows[slot])
+            assert index._lists[row] == list_id
+            assert index._slots[row] == slot
+            np.testing.assert_array_equal(partition.vectors[slot], index.vectors[row])
+            listed.append(row)
+    assert sorted(listed) == list(range(len(index)))
+
+
+def check_finds_everyone(index, users, vectors):
+    for user, vector in zip(users, vectors):
+        best, score = index.search(vector)[0]
+        assert best == user
+        assert score == pytest.approx(1.0, abs=1e-5)
+
+
+def test_exact_search_after_removals():
+    vectors = voiceprints(50)
+    index = VoiceIndex()
+    index.add_many(range(50), vectors)
+    for user in range(0, 50, 3):
+        index.remove(user)
+    remaining = [user for user in range(50) if user % 3]
+    check_bookkeeping(index)
+    check_finds_everyone(index, remaining, vectors[remaining])
+
+
+def test_remove_after_training_keeps_every_user_findable(small_partitions):
+    vectors = voiceprints(400)
+    index = VoiceIndex(approximate=True)
+    index.add_many(range(400), vectors)
+    assert index._centroids is not None
+
+    rng = np.random.default_rng(1)
+    removed = set(rng.choice(400, 150, replace=False).tolist())
+    for user in removed:
+        assert index.remove(user)
+    remaining = [user for user in range(400) if user not in removed]
+    check_bookkeeping(index)
+    check_finds_everyone(index, remaining, vectors[remaining])
+    assert all(index.search(vectors[user])[0][0] != user for user in removed)
+
+
+def test_re_adding_a_user_moves_their_partition(small_partitions):
+    vectors = voiceprints(401)
+    index = VoiceIndex(approximate=True)
+    index.add_many(range(400), vectors[:400])
+    index.add(7, vectors[400])
+    check_bookkeeping(index)
+    assert index.search(vectors[400])[0][0] == 7
+
+
+def test_search_survives_emptied_partitions(small_partitions):
+    vectors = voiceprints(400)
+    index = VoiceIndex(approximate=True)
+    index.add_many(range(400), vectors)
+    for user in range(395):
+        index.remove(user)
+    check_finds_everyone(index, range(395, 400), vectors[395:])
+    assert index._centroids is None
+
+
+def test_load_after_emptying_a_trained_index(small_partitions):
+    vectors = voiceprints(400)
+    index = VoiceIndex(approximate=True)
+    index.add_many(range(400), vectors)
+    for user in range(400):
+        index.remove(user)
+
+    fresh = voiceprints(10, seed=2)
+    index.load([f"user-{i}" for i in range(10)], fresh)
+    check_bookkeeping(index)
+    check_finds_everyone(index, [f"user-{i}" for i in range(10)], fresh)
@@ -0,0 +1,104 @@
+import time
+from concurrent.futures import Future
+
+from credentials import CredentialService
+from workers import ResultBridge, Worker
+
+
+class FakeWidget:
+    # Collects after() jobs so the test decides when the Tk loop runs
+    def __init__(self):
+        self.jobs = []
+
+    def after(self, ms, callback):
+        self.jobs.append(callback)
+        return len(self.jobs)
+
+    def run_pending(self):
+        jobs, self.jobs = self.jobs, []
+        for callback in jobs:
+            callback()
+
+    def run_until(self, done, timeout=5.0):
+        # Done callbacks of pool futures can land just after result() returns
+        deadline = time.monotonic() + timeout
+        while not done() and time.monotonic() < deadline:
+            self.run_pending()
+            time.sleep(0.001)
+
+
+def test_bridge_delivers_on_the_poll_and_then_goes_idle():
+    widget, seen = FakeWidget(), []
+    bridge = ResultBridge(widget)
+    first, second = Future(), Future()
+    bridge.watch(first, lambda f: seen.append(f.result()))
+    bridge.watch(second, lambda f: seen.append(f.result()))
+    assert len(widget.jobs) == 1
+
+    first.set_result(1)
+    assert seen == []
+    widget.run_pending()
+    assert seen == [1] and len(widget.jobs) == 1
+
+    second.set_result(2)
+    widget.run_pending()
+    assert seen == [1, 2] and widget.jobs == []
+
+
+def test_bridge_keeps_polling_after_a_failing_callback():
+    widget, seen = FakeWidget(), []
+    bridge = ResultBridge(widget)
+    failing, pending = Future(), Future()
+    bridge.watch(failing, lambda f: 1 / 0)
+    bridge.watch(pending, lambda f: seen.append(f.result()))
+    failing.set_result(None)
+    widget.run_pending()
+    pending.set_result("late")
+    widget.run_pending()
+    assert seen == ["late"]
+
+
+def test_bridge_without_widget_calls_back_directly():
+    seen = []
+    future = Future()
+    ResultBridge().watch(future, lambda f: seen.append(f.result()))
+    future.set_result("now")
+    assert seen == ["now"]
+
+
+def test_credentials_deliver_through_the_bridge():
+    widget, seen = FakeWidget(), []
+    service = CredentialService(widget, target_ms=1)
+    try:
+        service.hash("secret", on_done=seen.append)
+        widget.run_until(lambda: seen)
+        assert len(seen) == 1 and seen[0].startswith("scrypt$")
+        service.verify("secret", seen[0], on_done=seen.append)
+        widget.run_until(lambda: len(seen) == 2)
+        assert seen[1] is True and widget.jobs == []
+    finally:
+        service.shutdown()
+
+
+class Echo(Worker):
+    # Holds its run open until stopped, then reports the tag
+    def _run(self, tag):
+        self._stop.wait(5)
+        self.results.put((tag,))
+
+
+def test_worker_runs_one_job_until_stopped():
+    worker, seen = Echo(), []
+    assert worker.start("first")
+    assert worker.busy and not worker.start("second")
+    worker.stop()
+    worker._thread.join(5)
+    assert not worker.busy and worker.pending
+    worker.drain(seen.append)
+    assert seen == ["first"] and not worker.pending
+
+    assert worker.start("third") and worker.busy
+    worker.stop()
+    worker._thread.join(5)
+    worker.drain(seen.append)
+    assert seen == ["first", "third"]
@@ -0,0 +1,224 @@
+import ctypes
+import ctypes.util
+import fnmatch
+import os
+import queue
+import select
+import socket
+import struct
+import threading
+import time
+
+# ========== TOKEN SETTINGS ==========
+TOKEN_DIR_ENV = "KEYVOX_TOKEN_DIR"
+TOKEN_PATTERN_ENV = "KEYVOX_TOKEN_PATTERN"
+DEFAULT_TOKEN_DIR = "/dev/disk/by-id"
+DEFAULT_TOKEN_PATTERN = "usb-*"
+DEBOUNCE_SECONDS = 0.05
+FALLBACK_POLL_SECONDS = 1.0
+UI_POLL_MS = 50
+
+IN_CLOEXEC = 0o2000000
+IN_NONBLOCK = 0o4000
+IN_ATTRIB = 0x004
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_DELETE_SELF = 0x400
+IN_MOVE_SELF = 0x800
+WATCH_MASK = IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def _inotify():
+    # libc handle with the inotify calls, or None where inotify is unavailable
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1, libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class TokenMonitor:
+    # Watches a device directory (udev's /dev/disk/by-id by default) with inotify, so an
+    # idle monitor sleeps in select() instead of polling. Bursts of events are debounced,
+    # the directory is rescanned once, and only fields that changed are reported.
+    #
+    # The worker thread wakes the Tk thread through a socket pair registered with
+    # createfilehandler, or an after() poll where Tk has no file handlers (Windows).
+    # Without inotify, or if the worker dies, there is no thread at all: the attached
+    # widget rescans the directory every FALLBACK_POLL_SECONDS with after().
+    def __init__(self, directory=None, pattern=None, debounce=DEBOUNCE_SECONDS):
+        self.directory = directory or os.environ.get(TOKEN_DIR_ENV, DEFAULT_TOKEN_DIR)
+        self.pattern = pattern or os.environ.get(TOKEN_PATTERN_ENV, DEFAULT_TOKEN_PATTERN)
+        self.debounce = debounce
+        self.state = {"present": False, "token_id": None, "last_sync": None}
+        self.changes = queue.Queue()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._stop_r, self._stop_w = socket.socketpair()
+        for sock in (self._wake_r, self._wake_w, self._stop_r):
+            sock.setblocking(False)
+        self._ready = threading.Event()
+        self._thread = None
+        self._watching = False
+        self._widget = None
+        self._callback = None
+        self._file_handler = False
+        self._poll_job = None
+
+    @property
+    def watching(self):
+        # Cleared by the worker itself before its final wake-up, so the Tk side never races it
+        return self._watching
+
+    def scan(self):
+        try:
+            names = sorted(name for name in os.listdir(self.directory) if fnmatch.fnmatch(name, self.pattern))
+        except OSError:
+            names = []
+        return {"present": bool(names), "token_id": names[0] if names else None}
+
+    def start(self):
+        if self._thread is None:
+            self._apply(self.scan())
+            libc = _inotify()
+            if libc is not None:
+                self._watching = True
+                self._thread = threading.Thread(target=self._run, args=(libc,), name="keyvox-token", daemon=True)
+                self._thread.start()
+                self._ready.wait(timeout=1)
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop_w.send(b"x")
+            self._thread.join(timeout=1)
+            self._thread = None
+            self._watching = False
+        if self._widget is not None:
+            if self._file_handler:
+                self._widget.tk.deletefilehandler(self._wake_r.fileno())
+                self._file_handler = False
+            if self._poll_job is not None:
+                self._widget.after_cancel(self._poll_job)
+                self._poll_job = None
+        self._widget = None
+
+    def attach(self, widget, callback):
+        # callback(changed_fields) runs on the Tk thread
+        self._widget = widget
+        self._callback = callback
+        if self.watching and hasattr(widget.tk, "createfilehandler"):
+            import tkinter
+            widget.tk.createfilehandler(self._wake_r.fileno(), tkinter.READABLE, lambda *args: self._deliver())
+            self._file_handler = True
+        else:
+            self._poll()
+
+    def _poll(self):
+        self._poll_job = None
+        if self._widget is None:
+            return
+        if not self.watching:
+            self._apply(self.scan())
+        self._drain_changes()
+        interval = UI_POLL_MS if self.watching else int(FALLBACK_POLL_SECONDS * 1000)
+        self._poll_job = self._widget.after(interval, self._poll)
+
+    def _deliver(self):
+        self._drain_changes()
+        # The worker died: switch from its wake-ups to rescanning from the Tk side
+        if self._widget is not None and not self.watching and self._poll_job is None:
+            if self._file_handler:
+                self._widget.tk.deletefilehandler(self._wake_r.fileno())
+                self._file_handler = False
+            self._poll()
+
+    def _drain_changes(self):
+        try:
+            self._wake_r.recv(512)
+        except (BlockingIOError, InterruptedError):
+            pass
+        while True:
+            try:
+                changed = self.changes.get_nowait()
+            except queue.Empty:
+                return
+            if self._callback:
+                self._callback(changed)
+
+    def _apply(self, snapshot):
+        changed = {key: value for key, value in snapshot.items() if self.state.get(key) != value}
+        if not changed:
+            return
+        if snapshot["present"]:
+            changed["last_sync"] = time.time()
+        self.state.update(changed)
+        self.changes.put(changed)
+        try:
+            self._wake_w.send(b"x")
+        except (BlockingIOError, OSError):
+            pass
+
+    def _run(self, libc):
+        fd = libc.inotify_init1(IN_CLOEXEC | IN_NONBLOCK)
+        try:
+            while fd >= 0:
+                watch = libc.inotify_add_watch(fd, os.fsencode(self.directory), WATCH_MASK)
+                # Rescan once the watch is in place so nothing between scan and watch is missed
+                self._apply(self.scan())
+                self._ready.set()
+                if watch < 0:
+                    # The directory does not exist yet: fall back to a slow rescan
+                    ready, _, _ = select.select([self._stop_r], [], [], FALLBACK_POLL_SECONDS)
+                    if ready:
+                        return
+                    continue
+                if self._watch(fd):
+                    return
+        except Exception as e:
+            print(f"Token monitor stopped watching: {e}")
+        finally:
+            self._watching = False
+            self._ready.set()
+            if fd >= 0:
+                os.close(fd)
+            # Wake the Tk side so it notices and takes over with rescans
+            try:
+                self._wake_w.send(b"x")
+            except OSError:
+                pass
+
+    def _watch(self, fd):
+        # Blocks until the watch dies (returns False) or stop() is called (returns True)
+        while True:
+            ready, _, _ = select.select([fd, self._stop_r], [], [])
+            if self._stop_r in ready:
+                return True
+
+            # Debounce: keep draining until the directory has been quiet for `debounce`
+            alive = True
+            while ready:
+                alive = self._drain(fd) and alive
+                ready, _, _ = select.select([fd, self._stop_r], [], [], self.debounce)
+                if self._stop_r in ready:
+                    return True
+            self._apply(self.scan())
+            if not alive:
+                return False
+
+    def _drain(self, fd):
+        alive = True
+        try:
+            data = os.read(fd, 4096)
+        except BlockingIOError:
+            return True
+        offset = 0
+        while offset < len(data):
+            _wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                alive = False
+            offset += EVENT_HEADER.size + length
+        return alive
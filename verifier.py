@@ -0,0 +1,263 @@
+import argparse
+import json
+import math
+import os
+import time
+
+import numpy as np
+
+from audio import (CHUNK_FRAMES, MAX_PHRASE_SECONDS, SAMPLE_RATE, VAD_FLOOR, VAD_FRAME_MS, VAD_RELATIVE_DB,
+                   RingBuffer, WavSource, default_source, frame_energy, trim_silence)
+from store import DATA_DIR_ENV, DEFAULT_DATA_DIR
+from voiceprint import FRAME_MS, extract_voiceprint, mfcc_batch, normalize, resample
+from workers import Worker
+
+# ========== VERIFICATION SETTINGS ==========
+SEGMENT_SECONDS = 0.5
+MIN_VOICED_RATIO = 0.3
+# Error rates the sequential test is allowed to make; tighter rates need more audio
+FALSE_ACCEPT_RATE = 0.01
+FALSE_REJECT_RATE = 0.05
+# Gaussian model of the running cosine score against a genuine / impostor voiceprint as
+# (target mean, impostor mean, std after one segment); the std shrinks as 1/sqrt(segments).
+# This default is an uncalibrated placeholder for the CLI: (mean, std) MFCC embeddings of
+# unrelated voices also score close to 1. Voice login only runs on a model fitted with
+# fit_score_model and saved to SCORE_MODEL_ENV / <data dir>/SCORE_MODEL_NAME.
+SCORE_MODEL = (0.98, 0.95, 0.015)
+SCORE_MODEL_ENV = "KEYVOX_SCORE_MODEL"
+SCORE_MODEL_NAME = "score_model.json"
+# Model that never decides early, used to collect full score traces for fitting
+TRACE_MODEL = (1.0, 0.0, 1e3)
+
+ACCEPT = "accept"
+REJECT = "reject"
+
+
+class StreamingVerifier:
+    # Sequential probability ratio test on a running voiceprint score. Audio is fed in
+    # arbitrary chunks; every SEGMENT_SECONDS that contains speech adds its MFCC frames
+    # to running sums, from which the same (mean, std) embedding as the enrollment
+    # voiceprint is formed and scored. The log-likelihood ratio (genuine vs impostor)
+    # of that score grows with the amount of speech behind it, and the first time it
+    # crosses either Wald threshold the decision is final, so clear cases stop early.
+    def __init__(self, voiceprint, sample_rate=SAMPLE_RATE, false_accept=FALSE_ACCEPT_RATE,
+                 false_reject=FALSE_REJECT_RATE, segment_seconds=SEGMENT_SECONDS, score_model=SCORE_MODEL):
+        self.voiceprint = normalize(np.asarray(voiceprint, dtype=np.float32))
+        self.sample_rate = sample_rate
+        self.accept_at = math.log((1 - false_reject) / false_accept)
+        self.reject_at = math.log(false_reject / (1 - false_accept))
+        self.target_mean, self.impostor_mean, self.score_std = score_model
+        self.segment = np.zeros(int(sample_rate * segment_seconds), dtype=np.float32)
+        self.filled = 0
+        self.frame = max(1, sample_rate * VAD_FRAME_MS // 1000)
+        self.peak = 0.0
+        self.llr = 0.0
+        self.voiced = 0
+        self.sums = None
+        self.squares = None
+        self.frames = 0
+        self.scores = []
+        self.samples_seen = 0
+        self.decision = None
+
+    @property
+    def seconds(self):
+        return self.samples_seen / self.sample_rate
+
+    def feed(self, chunk):
+        # Returns ACCEPT or REJECT once decided, None while more audio is needed
+        while len(chunk) and self.decision is None:
+            take = min(len(chunk), len(self.segment) - self.filled)
+            self.segment[self.filled:self.filled + take] = chunk[:take]
+            self.filled += take
+            self.samples_seen += take
+            chunk = chunk[take:]
+            if self.filled == len(self.segment):
+                self.filled = 0
+                self._score(self.segment)
+        return self.decision
+
+    def finish(self):
+        # End of audio without a confident decision: score the tail, then fail closed
+        if self.decision is None and self.filled >= len(self.segment) // 2:
+            self._score(self.segment[:self.filled])
+            self.filled = 0
+        if self.decision is None:
+            self.decision = REJECT
+        return self.decision
+
+    def _score(self, segment):
+        energy = frame_energy(segment, self.frame)
+        if not len(energy):
+            return
+        self.peak = max(self.peak, float(energy.max()))
+        threshold = max(VAD_FLOOR, self.peak * 10 ** (-VAD_RELATIVE_DB / 10))
+        if np.mean(energy > threshold) < MIN_VOICED_RATIO:
+            return
+        speech = resample(trim_silence(segment, self.sample_rate), self.sample_rate)
+        if len(speech) < SAMPLE_RATE * FRAME_MS // 1000:
+            return
+        mfcc = mfcc_batch(speech[None, :])[0].astype(np.float64)
+        if self.sums is None:
+            self.sums, self.squares = mfcc.sum(axis=0), (mfcc ** 2).sum(axis=0)
+        else:
+            self.sums += mfcc.sum(axis=0)
+            self.squares += (mfcc ** 2).sum(axis=0)
+        self.frames += len(mfcc)
+        self.voiced += 1
+
+        mean = self.sums / self.frames
+        std = np.sqrt(np.maximum(self.squares / self.frames - mean ** 2, 0.0))
+        score = float(normalize(np.concatenate((mean, std)).astype(np.float32)) @ self.voiceprint)
+        self.scores.append(score)
+        variance = self.score_std ** 2 / self.voiced
+        self.llr = ((score - self.impostor_mean) ** 2 - (score - self.target_mean) ** 2) / (2 * variance)
+        if self.llr >= self.accept_at:
+            self.decision = ACCEPT
+        elif self.llr <= self.reject_at:
+            self.decision = REJECT
+
+
+def fit_score_model(genuine, impostor):
+    # Score traces (StreamingVerifier.scores) of known genuine and impostor probes ->
+    # SCORE_MODEL. Means come from the final scores; the one-segment std from how far
+    # each running score sits from its probe's final score, scaled by sqrt(segments).
+    finals = [np.mean([trace[-1] for trace in traces]) for traces in (genuine, impostor)]
+    spread = [(score - trace[-1]) * np.sqrt(k) for trace in (*genuine, *impostor)
+              for k, score in enumerate(trace[:-1], 1)]
+    return float(finals[0]), float(finals[1]), max(float(np.sqrt(np.mean(np.square(spread)))) if spread else 0.0,
+                                                   1e-4)
+
+
+def score_model_path():
+    return os.environ.get(SCORE_MODEL_ENV) or os.path.join(os.environ.get(DATA_DIR_ENV) or DEFAULT_DATA_DIR,
+                                                           SCORE_MODEL_NAME)
+
+
+def save_score_model(model, path=None):
+    path = path or score_model_path()
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    target_mean, impostor_mean, score_std = model
+    with open(path, "w") as f:
+        json.dump({"target_mean": target_mean, "impostor_mean": impostor_mean, "score_std": score_std}, f, indent=2)
+    return path
+
+
+def load_score_model(path=None):
+    # Fitted model from config, or None when there is none or it cannot separate the classes
+    try:
+        with open(path or score_model_path()) as f:
+            data = json.load(f)
+        model = (float(data["target_mean"]), float(data["impostor_mean"]), float(data["score_std"]))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if model[0] <= model[1] or model[2] <= 0:
+        return None
+    return model
+
+
+def verify_source(source, voiceprint, max_seconds=MAX_PHRASE_SECONDS, chunk_frames=CHUNK_FRAMES,
+                  stop=None, **options):
+    # Streams an open source (WavSource, MicrophoneSource) through a verifier
+    buffer = RingBuffer(int(source.sample_rate * max_seconds))
+    verifier = StreamingVerifier(voiceprint, source.sample_rate, **options)
+    while buffer.total < buffer.capacity and not (stop and stop.is_set()):
+        count = buffer.fill(source.readinto, chunk_frames)
+        if not count or verifier.feed(buffer.latest(count)):
+            break
+    # A cancelled run stays undecided rather than counting as a reject
+    if not (stop and stop.is_set()):
+        verifier.finish()
+    return verifier
+
+
+class VoiceVerifier(Worker):
+    # Runs one streaming verification per start(tag, voiceprint). Results are put on
+    # `results` as (tag, decision, seconds, error); decision is None
+    # if the run was stopped before it decided. Without a fitted score model (passed in
+    # or found by load_score_model) it is disabled and start() refuses to run.
+    def __init__(self, source_factory=default_source, max_seconds=MAX_PHRASE_SECONDS, score_model=None):
+        super().__init__()
+        self.source_factory = source_factory
+        self.max_seconds = max_seconds
+        self.score_model = score_model or load_score_model()
+
+    @property
+    def enabled(self):
+        return self.score_model is not None
+
+    def start(self, tag, voiceprint):
+        if not self.enabled:
+            return False
+        return super().start(tag, voiceprint)
+
+    def _run(self, tag, voiceprint):
+        try:
+            with self.source_factory() as source:
+                verifier = verify_source(source, voiceprint, self.max_seconds, stop=self._stop,
+                                         score_model=self.score_model)
+            self.results.put((tag, verifier.decision, verifier.seconds, None))
+        except Exception as e:
+            self.results.put((tag, None, 0.0, e))
+
+
+# =========================================================
+# WAV EVALUATION
+# =========================================================
+def read_wav(path):
+    with WavSource(path) as source:
+        samples = np.zeros(source.frames, dtype=np.float32)
+        count = source.readinto(samples)
+        return samples[:count], source.sample_rate
+
+
+def evaluate(enroll_paths, probe_paths, **options):
+    # Enroll from some WAVs, then stream each probe WAV; compares the audio consumed
+    # before deciding with the full (trimmed) phrase a batch verifier would need
+    phrases = [read_wav(path) for path in enroll_paths]
+    voiceprint = extract_voiceprint([samples for samples, _ in phrases], phrases[0][1])
+    rows = []
+    for path in probe_paths:
+        start = time.perf_counter()
+        with WavSource(path) as source:
+            verifier = verify_source(source, voiceprint, **options)
+        elapsed = time.perf_counter() - start
+        samples, sample_rate = read_wav(path)
+        full = len(trim_silence(samples, sample_rate)) / sample_rate
+        rows.append((path, verifier.decision, verifier.seconds, full, elapsed * 1000, verifier.scores))
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stream WAV probes through the voice verifier")
+    parser.add_argument("--enroll", nargs="+", required=True, help="enrollment phrase WAVs")
+    parser.add_argument("probes", nargs="+", help="probe WAVs to verify against the enrollment")
+    parser.add_argument("--false-accept", type=float, default=FALSE_ACCEPT_RATE)
+    parser.add_argument("--false-reject", type=float, default=FALSE_REJECT_RATE)
+    parser.add_argument("--score-model", type=float, nargs=3, metavar=("TARGET", "IMPOSTOR", "STD"),
+                        help="defaults to the configured fitted model, else the uncalibrated placeholder")
+    parser.add_argument("--impostors", nargs="+", default=[],
+                        help="impostor WAVs; fits the score model to them and the (genuine) probes first")
+    parser.add_argument("--save", action="store_true",
+                        help=f"store the fitted model where the app loads it (${SCORE_MODEL_ENV} or the data dir)")
+    args = parser.parse_args()
+
+    score_model = tuple(args.score_model) if args.score_model else load_score_model() or SCORE_MODEL
+    if args.impostors:
+        traces = [row[5] for row in evaluate(args.enroll, args.probes + args.impostors, score_model=TRACE_MODEL)]
+        score_model = fit_score_model(traces[:len(args.probes)], traces[len(args.probes):])
+        print("fitted score model: " + " ".join(f"{value:.4f}" for value in score_model))
+        if args.save:
+            print(f"saved to {save_score_model(score_model)}")
+    elif args.save:
+        parser.error("--save needs --impostors to fit a model")
+
+    rows = evaluate(args.enroll, args.probes + args.impostors, false_accept=args.false_accept,
+                    false_reject=args.false_reject, score_model=score_model)
+    print(f"{'probe':<32} {'decision':>8} {'audio s':>8} {'phrase s':>9} {'cpu ms':>7}  scores")
+    for path, decision, seconds, full, cpu_ms, scores in rows:
+        print(f"{path[-32:]:<32} {decision:>8} {seconds:>8.2f} {full:>9.2f} {cpu_ms:>7.1f}  "
+              + " ".join(f"{s:.3f}" for s in scores))
+    if rows:
+        print(f"median audio to decision: {np.median([r[2] for r in rows]):.2f} s "
+              f"vs full phrase {np.median([r[3] for r in rows]):.2f} s")
@@ -0,0 +1,80 @@
+from collections import OrderedDict
+
+import customtkinter as ctk
+
+# ========== VIEW SETTINGS ==========
+MAX_HIDDEN_VIEWS = 4
+
+
+class ViewManager:
+    # Builds each page once into its own frame, stacked in a single grid cell,
+    # and swaps pages by raising them. Hidden views beyond max_hidden are
+    # destroyed least-recently-shown first and rebuilt on their next visit.
+    def __init__(self, container, fg_color="transparent", max_hidden=MAX_HIDDEN_VIEWS):
+        self.container = container
+        self.fg_color = fg_color
+        self.max_hidden = max_hidden
+        self.current = None
+        self._builders = {}
+        self._views = OrderedDict()
+
+        container.grid_rowconfigure(0, weight=1)
+        container.grid_columnconfigure(0, weight=1)
+
+    def register(self, name, builder):
+        self._builders[name] = builder
+        self.invalidate(name)
+
+    def show(self, name):
+        view = self._views.get(name)
+        if view is None or not view.winfo_exists():
+            view = self._build(name)
+
+        view.tkraise()
+        self._views.move_to_end(name)
+        self.current = name
+        self._evict()
+        return view
+
+    def prewarm(self, name):
+        # Builds a view ahead of its first visit, underneath the current one. Skipped when
+        # it would push the hidden views past max_hidden and so evict another page.
+        if not self.container.winfo_exists() or name in self._views:
+            return None
+        if len(self._views) - (self.current is not None) >= self.max_hidden:
+            return None
+        view = self._build(name)
+        view.lower()
+        self._views.move_to_end(name, last=False)
+        return view
+
+    def get(self, name):
+        return self._views.get(name)
+
+    def invalidate(self, name=None):
+        names = list(self._views) if name is None else [name]
+        rebuild = self.current in names
+        for key in names:
+            view = self._views.pop(key, None)
+            if view is not None:
+                view.destroy()
+        if rebuild:
+            self.show(self.current)
+
+    def clear(self):
+        for view in self._views.values():
+            view.destroy()
+        self._views.clear()
+        self.current = None
+
+    def _build(self, name):
+        view = ctk.CTkFrame(self.container, fg_color=self.fg_color)
+        view.grid(row=0, column=0, sticky="nsew")
+        self._builders[name](view)
+        self._views[name] = view
+        return view
+
+    def _evict(self):
+        hidden = [key for key in self._views if key != self.current]
+        while len(hidden) > self.max_hidden:
+            self._views.pop(hidden.pop(0)).destroy()
@@ -0,0 +1,175 @@
+import itertools
+import math
+from collections import OrderedDict
+
+import customtkinter as ctk
+
+# ========== LIST SETTINGS ==========
+PAGE_SIZE = 200
+MAX_PAGES = 4
+WHEEL_ROWS = 3
+
+
+class VirtualList(ctk.CTkFrame):
+    # Scrolling list that only materializes the rows that fit in the viewport (plus
+    # one). Row containers are recycled as a ring: item i always lands in slot
+    # i % len(pool), so scrolling by one row rebinds one row and re-places the rest.
+    # Items are pulled from an iterator PAGE_SIZE at a time as the view approaches
+    # them; without a `count` hint the scroll range grows as pages arrive. Long lists
+    # pass `count` and fetch(offset, limit) instead: only the pages the view lands on
+    # are read, and just the MAX_PAGES most recently used stay in memory.
+    #
+    # make_row(container) fills a fixed-height container once and returns a handle to
+    # its widgets; bind_row(handle, item) points them at an item. Scroll events are
+    # coalesced into one after_idle render.
+    def __init__(self, master, row_height, make_row, bind_row, source=(), count=None, fetch=None,
+                 page_size=PAGE_SIZE, **kwargs):
+        super().__init__(master, **kwargs)
+        self.row_height = row_height
+        self.make_row = make_row
+        self.bind_row = bind_row
+        self.page_size = page_size
+        self.offset = 0.0
+        self._pool = []
+        self._bound = []
+        self._ring = 0
+        self._render_job = None
+
+        self._scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self._scrollbar.pack(side="right", fill="y")
+        self._viewport = ctk.CTkFrame(self, fg_color="transparent", corner_radius=0)
+        self._viewport.pack(side="left", fill="both", expand=True)
+        self._viewport.bind("<Configure>", lambda event: self._schedule())
+        self._bind_wheel(self._viewport)
+        self.reset(source, count, fetch)
+
+    def reset(self, source=(), count=None, fetch=None):
+        self._source = iter(source)
+        self._fetch = fetch
+        self._items = []
+        self._pages = OrderedDict()
+        self._exhausted = fetch is not None
+        self.count = count
+        self.offset = 0.0
+        self._bound = [None] * len(self._pool)
+        self._schedule()
+
+    @property
+    def total(self):
+        # One placeholder row past the loaded items keeps the next page reachable
+        if self.count is not None or self._fetch is not None:
+            return self.count or 0
+        return len(self._items) + (0 if self._exhausted else 1)
+
+    def scroll_to(self, offset):
+        self.offset = offset
+        self._schedule()
+
+    # --- Data paging ---
+    def _ensure(self, index):
+        while len(self._items) <= index and not self._exhausted:
+            page = list(itertools.islice(self._source, self.page_size))
+            self._items.extend(page)
+            if len(page) < self.page_size:
+                self._exhausted = True
+                self.count = len(self._items)
+
+    def _item(self, index):
+        # None past the end, including a fetched page that came back short
+        if self._fetch is None:
+            return self._items[index] if index < len(self._items) else None
+        number, row = divmod(index, self.page_size)
+        if number in self._pages:
+            self._pages.move_to_end(number)
+        else:
+            self._pages[number] = self._fetch(number * self.page_size, self.page_size)
+            # Always room for every page one render can touch
+            while len(self._pages) > max(MAX_PAGES, self._ring // self.page_size + 2):
+                self._pages.popitem(last=False)
+        page = self._pages[number]
+        return page[row] if row < len(page) else None
+
+    # --- Rendering ---
+    def _schedule(self):
+        if self._render_job is None:
+            self._render_job = self.after_idle(self._render)
+
+    def _render(self):
+        self._render_job = None
+        scale = ctk.ScalingTracker.get_widget_scaling(self)
+        height = max(1, self._viewport.winfo_height()) / scale
+        visible = math.ceil(height / self.row_height) + 1
+        while len(self._pool) < visible:
+            container = ctk.CTkFrame(self._viewport, height=self.row_height, fg_color="transparent", corner_radius=0)
+            container.pack_propagate(False)
+            row = self.make_row(container)
+            self._bind_wheel(container)
+            self._pool.append((container, row))
+            self._bound.append(None)
+        pool = self._pool[:visible]
+        for container, _ in self._pool[visible:]:
+            container.place_forget()
+        if visible != self._ring:
+            # The ring size decides the index -> slot mapping, so a resize rebinds everything
+            self._ring = visible
+            self._bound = [None] * len(self._pool)
+
+        first = int(max(0.0, self.offset) // self.row_height)
+        self._ensure(first + visible)
+        span = self.total * self.row_height
+        self.offset = min(max(0.0, self.offset), max(0.0, span - height))
+        first = int(self.offset // self.row_height)
+
+        for index in range(first, first + visible):
+            slot = index % visible
+            container, row = pool[slot]
+            if self._bound[slot] != index:
+                item = self._item(index) if index < self.total else None
+                if item is None:
+                    container.place_forget()
+                    self._bound[slot] = None
+                    continue
+                self.bind_row(row, item)
+                self._bound[slot] = index
+            container.place(x=0, y=index * self.row_height - self.offset, relwidth=1)
+
+        if span > 0:
+            self._scrollbar.set(self.offset / span, min(1.0, (self.offset + height) / span))
+        else:
+            self._scrollbar.set(0.0, 1.0)
+
+    # --- Input ---
+    def _on_scrollbar(self, action, value, unit=None):
+        span = self.total * self.row_height
+        if action == "moveto":
+            self.offset = float(value) * span
+        elif unit == "pages":
+            self.offset += int(value) * self._viewport.winfo_height() / ctk.ScalingTracker.get_widget_scaling(self)
+        else:
+            self.offset += int(value) * self.row_height
+        self._schedule()
+
+    def _on_wheel(self, event):
+        if event.num == 4:
+            steps = -1
+        elif event.num == 5:
+            steps = 1
+        else:
+            steps = -event.delta / (120 if abs(event.delta) >= 120 else 1)
+        self.offset += steps * WHEEL_ROWS * self.row_height
+        self._schedule()
+        return "break"
+
+    def _bind_wheel(self, widget):
+        # CTk widgets route bind() to their own internals, so only recurse through CTk children
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            widget.bind(sequence, self._on_wheel, add="+")
+        for child in widget.winfo_children():
+            if isinstance(child, ctk.CTkBaseClass):
+                self._bind_wheel(child)
+
+    def destroy(self):
+        if self._render_job is not None:
+            self.after_cancel(self._render_job)
+            self._render_job = None
+        super().destroy()
@@ -0,0 +1,262 @@
+import argparse
+import time
+
+import numpy as np
+
+from voiceprint import VOICEPRINT_DIM, normalize
+
+# ========== INDEX SETTINGS ==========
+INITIAL_CAPACITY = 1024
+APPROX_MIN_SIZE = 20000
+APPROX_LIST_SIZE = 1000
+APPROX_PROBES = 8
+KMEANS_ITERATIONS = 8
+KMEANS_SAMPLE = 50000
+
+
+class _Partition:
+    # One k-means list: its own dense copy of member vectors plus their index rows
+    def __init__(self, dim, capacity=64):
+        self.vectors = np.zeros((capacity, dim), dtype=np.float32)
+        self.rows = np.zeros(capacity, dtype=np.int64)
+        self.size = 0
+
+    def append(self, row, vector):
+        if self.size == len(self.rows):
+            self.vectors = np.concatenate((self.vectors, np.zeros_like(self.vectors)))
+            self.rows = np.concatenate((self.rows, np.zeros_like(self.rows)))
+        self.vectors[self.size] = vector
+        self.rows[self.size] = row
+        self.size += 1
+        return self.size - 1
+
+    def pop(self, slot):
+        # Swap the last member into slot; returns the index row that moved, if any
+        self.size -= 1
+        if slot == self.size:
+            return None
+        self.vectors[slot] = self.vectors[self.size]
+        self.rows[slot] = self.rows[self.size]
+        return int(self.rows[slot])
+
+
+class VoiceIndex:
+    # 1:N identification over normalized voiceprints kept as one contiguous float32
+    # matrix, so scoring every user is a single matrix-vector product. Removal swaps
+    # the last row into the hole to keep the matrix dense.
+    #
+    # With approximate=True the rows are also partitioned by spherical k-means once
+    # the index holds APPROX_MIN_SIZE users. Each partition keeps its own dense copy
+    # of its members, so a search only scans the `probes` partitions whose centroids
+    # are closest to the probe.
+    def __init__(self, dim=VOICEPRINT_DIM, capacity=INITIAL_CAPACITY,
+                 approximate=False, probes=APPROX_PROBES):
+        self.dim = dim
+        self.approximate = approximate
+        self.probes = probes
+        self._vectors = np.zeros((capacity, dim), dtype=np.float32)
+        self._lists = np.zeros(capacity, dtype=np.int32)
+        self._slots = np.zeros(capacity, dtype=np.int64)
+        self._partitions = []
+        self._ids = []
+        self._rows = {}
+        self._centroids = None
+        self._trained_size = 0
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, user_id):
+        return user_id in self._rows
+
+    @property
+    def vectors(self):
+        return self._vectors[:len(self._ids)]
+
+    def add(self, user_id, voiceprint):
+        vector = normalize(np.asarray(voiceprint, dtype=np.float32).reshape(self.dim))
+        row = self._rows.get(user_id)
+        if row is None:
+            row = len(self._ids)
+            if row == len(self._vectors):
+                self._grow()
+            self._ids.append(user_id)
+            self._rows[user_id] = row
+        elif self._centroids is not None:
+            self._unlist(row)
+        self._vectors[row] = vector
+        if self._centroids is not None:
+            self._enlist(row, int(np.argmax(self._centroids @ vector)))
+        self._maybe_train()
+
+    def get(self, user_id):
+        row = self._rows.get(user_id)
+        return None if row is None else self._vectors[row].copy()
+
+    def add_many(self, user_ids, voiceprints):
+        for user_id, voiceprint in zip(user_ids, voiceprints):
+            self.add(user_id, voiceprint)
+
+    def load(self, user_ids, voiceprints):
+        # Bulk startup load into an empty index: one vectorized copy instead of per-user
+        # adds. Partitioning is left to the first search so opening stays cheap.
+        user_ids = list(user_ids)
+        if len(self._ids):
+            raise ValueError("load() needs an empty index")
+        while len(self._vectors) < len(user_ids):
+            self._grow()
+        # Partitions left from before the index was emptied describe rows that are gone
+        self._reset_partitions()
+        self._vectors[:len(user_ids)] = normalize(np.asarray(voiceprints, dtype=np.float32).reshape(-1, self.dim))
+        self._ids = user_ids
+        self._rows = {user_id: row for row, user_id in enumerate(user_ids)}
+
+    def remove(self, user_id):
+        row = self._rows.pop(user_id, None)
+        if row is None:
+            return False
+        if self._centroids is not None:
+            self._unlist(row)
+        last = len(self._ids) - 1
+        if row != last:
+            moved = self._ids[last]
+            self._vectors[row] = self._vectors[last]
+            self._lists[row] = self._lists[last]
+            self._slots[row] = self._slots[last]
+            if self._centroids is not None:
+                self._partitions[self._lists[row]].rows[self._slots[row]] = row
+            self._ids[row] = moved
+            self._rows[moved] = row
+        self._ids.pop()
+        return True
+
+    def search(self, probe, k=1):
+        # Best k (user_id, cosine score) pairs, highest score first
+        self._maybe_train()
+        count = len(self._ids)
+        if not count:
+            return []
+        query = normalize(np.asarray(probe, dtype=np.float32).reshape(self.dim))
+
+        if self._centroids is not None:
+            probes = min(self.probes, len(self._centroids))
+            nearest = np.argpartition(self._centroids @ query, -probes)[-probes:]
+            parts = [self._partitions[i] for i in nearest if self._partitions[i].size]
+        else:
+            parts = []
+        if parts:
+            rows = np.concatenate([p.rows[:p.size] for p in parts])
+            scores = np.concatenate([p.vectors[:p.size] @ query for p in parts])
+        else:
+            # Exact scan, also when every probed partition has been emptied by removals
+            rows = None
+            scores = self.vectors @ query
+
+        k = min(k, len(scores))
+        if not k:
+            return []
+        top = np.argpartition(scores, -k)[-k:]
+        top = top[np.argsort(scores[top])[::-1]]
+        if rows is not None:
+            return [(self._ids[rows[i]], float(scores[i])) for i in top]
+        return [(self._ids[i], float(scores[i])) for i in top]
+
+    def identify(self, probe, threshold):
+        best = self.search(probe, k=1)
+        if best and best[0][1] >= threshold:
+            return best[0][0]
+        return None
+
+    def train(self, n_lists=None, iterations=KMEANS_ITERATIONS, seed=0):
+        # Spherical k-means over (a sample of) the current rows, then assign every row
+        count = len(self._ids)
+        n_lists = n_lists or max(1, count // APPROX_LIST_SIZE)
+        if count < n_lists:
+            return
+        rng = np.random.default_rng(seed)
+        sample = self.vectors
+        if count > KMEANS_SAMPLE:
+            sample = sample[rng.choice(count, KMEANS_SAMPLE, replace=False)]
+
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+        for _ in range(iterations):
+            assign = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, sample)
+            empty = ~sums.any(axis=1)
+            sums[empty] = centroids[empty]
+            centroids = normalize(sums)
+
+        self._centroids = centroids
+        self._partitions = [_Partition(self.dim) for _ in range(n_lists)]
+        self._lists[:count] = np.argmax(self.vectors @ centroids.T, axis=1)
+        for row in range(count):
+            self._enlist(row, self._lists[row])
+        self._trained_size = count
+
+    def _maybe_train(self):
+        # Retrain when the index first gets large enough and whenever it doubles or
+        # halves; below APPROX_MIN_SIZE partitioning is dropped again
+        count = len(self._ids)
+        if not self.approximate:
+            return
+        if self._centroids is not None and 2 * count <= self._trained_size:
+            self._reset_partitions()
+        if count >= APPROX_MIN_SIZE and count >= 2 * self._trained_size:
+            self.train()
+
+    def _reset_partitions(self):
+        self._centroids = None
+        self._partitions = []
+        self._trained_size = 0
+
+    def _enlist(self, row, list_id):
+        self._lists[row] = list_id
+        self._slots[row] = self._partitions[list_id].append(row, self._vectors[row])
+
+    def _unlist(self, row):
+        moved = self._partitions[self._lists[row]].pop(self._slots[row])
+        if moved is not None:
+            self._slots[moved] = self._slots[row]
+
+    def _grow(self):
+        capacity = 2 * len(self._vectors)
+        vectors = np.zeros((capacity, self.dim), dtype=np.float32)
+        vectors[:len(self._vectors)] = self._vectors
+        lists = np.zeros(capacity, dtype=np.int32)
+        lists[:len(self._lists)] = self._lists
+        slots = np.zeros(capacity, dtype=np.int64)
+        slots[:len(self._slots)] = self._slots
+        self._vectors, self._lists, self._slots = vectors, lists, slots
+
+
+# =========================================================
+# BENCHMARK
+# =========================================================
+def benchmark(size=100000, queries=200, approximate=False, seed=0):
+    rng = np.random.default_rng(seed)
+    data = normalize(rng.standard_normal((size, VOICEPRINT_DIM)).astype(np.float32))
+    index = VoiceIndex(capacity=size, approximate=approximate)
+    start = time.perf_counter()
+    index.add_many(range(size), data)
+    build = time.perf_counter() - start
+
+    probes = normalize(data[rng.choice(size, queries)] + 0.05 * rng.standard_normal((queries, VOICEPRINT_DIM)))
+    start = time.perf_counter()
+    hits = [index.search(p)[0][0] for p in probes]
+    latency = (time.perf_counter() - start) / queries
+    return build, latency, hits
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time 1:N voiceprint identification")
+    parser.add_argument("--size", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    exact_build, exact_latency, exact_hits = benchmark(args.size, args.queries)
+    approx_build, approx_latency, approx_hits = benchmark(args.size, args.queries, approximate=True)
+    agreement = np.mean([a == b for a, b in zip(exact_hits, approx_hits)])
+    print(f"exact:       build {exact_build:.2f}s, search {exact_latency * 1000:.3f} ms")
+    print(f"approximate: build {approx_build:.2f}s, search {approx_latency * 1000:.3f} ms, "
+          f"agrees with exact on {agreement:.1%}")
@@ -0,0 +1,172 @@
+import argparse
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from audio import SAMPLE_RATE
+
+# ========== FEATURE SETTINGS ==========
+FRAME_MS = 25
+HOP_MS = 10
+N_FFT = 512
+N_MELS = 40
+N_MFCC = 20
+PRE_EMPHASIS = 0.97
+VOICEPRINT_DIM = 2 * N_MFCC
+
+
+# =========================================================
+# FILTERBANKS
+# =========================================================
+def hz_to_mel(hz):
+    return 2595.0 * np.log10(1.0 + hz / 700.0)
+
+
+def mel_to_hz(mel):
+    return 700.0 * (10 ** (mel / 2595.0) - 1.0)
+
+
+@lru_cache(maxsize=8)
+def mel_filterbank(sample_rate, n_fft=N_FFT, n_mels=N_MELS):
+    # (n_fft // 2 + 1, n_mels) triangular filters, so power @ bank gives mel energies
+    points = mel_to_hz(np.linspace(hz_to_mel(0.0), hz_to_mel(sample_rate / 2), n_mels + 2))
+    bins = np.fft.rfftfreq(n_fft, 1.0 / sample_rate)[:, None]
+    lower, centre, upper = points[:-2], points[1:-1], points[2:]
+    rising = (bins - lower) / (centre - lower)
+    falling = (upper - bins) / (upper - centre)
+    return np.maximum(0.0, np.minimum(rising, falling)).astype(np.float32)
+
+
+@lru_cache(maxsize=8)
+def dct_matrix(n_mels=N_MELS, n_mfcc=N_MFCC):
+    # Orthonormal DCT-II basis, (n_mels, n_mfcc)
+    n = np.arange(n_mels)[:, None]
+    k = np.arange(n_mfcc)[None, :]
+    basis = np.cos(np.pi * k * (2 * n + 1) / (2 * n_mels)) * np.sqrt(2.0 / n_mels)
+    basis[:, 0] /= np.sqrt(2.0)
+    return basis.astype(np.float32)
+
+
+@lru_cache(maxsize=8)
+def window(frame_len):
+    return np.hamming(frame_len).astype(np.float32)
+
+
+# =========================================================
+# FEATURE EXTRACTION
+# =========================================================
+def resample(samples, sample_rate, target=SAMPLE_RATE):
+    if sample_rate == target:
+        return samples
+    positions = np.arange(int(len(samples) * target / sample_rate)) * (sample_rate / target)
+    return np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+
+
+def pad_batch(phrases):
+    # Stack variable-length phrases into one zero-padded (batch, samples) array
+    lengths = np.array([len(p) for p in phrases])
+    batch = np.zeros((len(phrases), max(lengths.max(), 1)), dtype=np.float32)
+    for row, phrase in zip(batch, phrases):
+        row[:len(phrase)] = phrase
+    return batch, lengths
+
+
+def mfcc_batch(batch, sample_rate=SAMPLE_RATE):
+    # (batch, samples) -> (batch, frames, N_MFCC), every stage one vectorized call
+    frame_len = sample_rate * FRAME_MS // 1000
+    hop = sample_rate * HOP_MS // 1000
+    if batch.shape[1] < frame_len:
+        batch = np.pad(batch, ((0, 0), (0, frame_len - batch.shape[1])))
+
+    emphasized = np.empty_like(batch)
+    emphasized[:, 0] = batch[:, 0]
+    emphasized[:, 1:] = batch[:, 1:] - PRE_EMPHASIS * batch[:, :-1]
+
+    frames = sliding_window_view(emphasized, frame_len, axis=1)[:, ::hop] * window(frame_len)
+    power = np.abs(np.fft.rfft(frames, n=N_FFT, axis=-1)).astype(np.float32) ** 2 / N_FFT
+    mel = np.log(power @ mel_filterbank(sample_rate) + 1e-10)
+    return mel @ dct_matrix()
+
+
+def embed_batch(phrases, sample_rate=SAMPLE_RATE):
+    # One L2-normalized (mean, std) MFCC embedding per phrase, shape (batch, VOICEPRINT_DIM)
+    phrases = [resample(np.asarray(p, dtype=np.float32), sample_rate) for p in phrases]
+    batch, lengths = pad_batch(phrases)
+    mfcc = mfcc_batch(batch)
+
+    # Mask out frames that only cover zero padding, then pool per phrase
+    frame_len = SAMPLE_RATE * FRAME_MS // 1000
+    hop = SAMPLE_RATE * HOP_MS // 1000
+    counts = np.maximum(1, (lengths - frame_len) // hop + 1)
+    mask = (np.arange(mfcc.shape[1])[None, :] < counts[:, None])[..., None]
+    mean = (mfcc * mask).sum(axis=1) / counts[:, None]
+    centred = (mfcc - mean[:, None, :]) * mask
+    std = np.sqrt((centred ** 2).sum(axis=1) / counts[:, None])
+
+    embeddings = np.concatenate((mean, std), axis=1).astype(np.float32)
+    return normalize(embeddings)
+
+
+def normalize(vectors):
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return (vectors / np.maximum(norms, 1e-12)).astype(np.float32)
+
+
+def extract_voiceprint(phrases, sample_rate=SAMPLE_RATE):
+    # Compact float32 voiceprint: the normalized centroid of the phrase embeddings
+    return normalize(embed_batch(phrases, sample_rate).mean(axis=0))
+
+
+# =========================================================
+# BACKGROUND EXTRACTION
+# =========================================================
+class VoiceprintExtractor:
+    # Runs extraction in a worker process so FFT work never competes with the Tk loop.
+    # The pool is started lazily on first use and spawned, not forked, from the GUI process.
+    def __init__(self, max_workers=1):
+        self.max_workers = max_workers
+        self._pool = None
+
+    def submit(self, phrases, sample_rate=SAMPLE_RATE):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers,
+                                             mp_context=multiprocessing.get_context("spawn"))
+        return self._pool.submit(extract_voiceprint, phrases, sample_rate)
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# =========================================================
+# BENCHMARK
+# =========================================================
+def benchmark(seconds=(1, 3, 5), phrases=5, repeat=20):
+    rng = np.random.default_rng(0)
+    rows = []
+    for duration in seconds:
+        batch = [rng.standard_normal(SAMPLE_RATE * duration).astype(np.float32) * 0.1
+                 for _ in range(phrases)]
+        extract_voiceprint(batch)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            extract_voiceprint(batch)
+        elapsed = (time.perf_counter() - start) / repeat
+        rows.append((duration, elapsed * 1000, elapsed * 1000 / (duration * phrases)))
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time voiceprint extraction per second of audio")
+    parser.add_argument("--phrases", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'phrase s':>9} {'batch ms':>10} {'ms / audio s':>13}")
+    for duration, batch_ms, per_second in benchmark(phrases=args.phrases, repeat=args.repeat):
+        print(f"{duration:>9} {batch_ms:>10.2f} {per_second:>13.3f}")
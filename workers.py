@@ -0,0 +1,88 @@
+import queue
+import threading
+
+# ========== WORKER SETTINGS ==========
+RESULT_POLL_MS = 30
+
+
+class ResultBridge:
+    # Hands finished futures back to the Tk thread. Futures are queued by whichever
+    # thread completes them and drained by an after() poll that only runs while some
+    # are outstanding. Without a widget, callbacks run on the completing thread.
+    def __init__(self, widget=None, poll_ms=RESULT_POLL_MS):
+        self.widget = widget
+        self.poll_ms = poll_ms
+        self._finished = queue.Queue()
+        self._pending = 0
+        self._polling = False
+
+    def watch(self, future, callback):
+        # callback(future) once it is done, cancelled futures included
+        if self.widget is None:
+            future.add_done_callback(callback)
+            return future
+        self._pending += 1
+        future.add_done_callback(lambda f: self._finished.put((f, callback)))
+        if not self._polling:
+            self._polling = True
+            self.widget.after(self.poll_ms, self._poll)
+        return future
+
+    def _poll(self):
+        while True:
+            try:
+                future, callback = self._finished.get_nowait()
+            except queue.Empty:
+                break
+            self._pending -= 1
+            # One failing callback must not stop the poll for everything still in flight
+            try:
+                callback(future)
+            except Exception as e:
+                print(f"Result callback error: {e}")
+
+        if self._pending:
+            self.widget.after(self.poll_ms, self._poll)
+        else:
+            self._polling = False
+
+
+class Worker:
+    # Runs one job at a time on a daemon thread. Subclasses implement _run(*args), put
+    # their results on `results` and check `_stop` to end early; the UI drains results
+    # with an after() poll for as long as `pending` holds.
+    def __init__(self):
+        self.results = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def busy(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def pending(self):
+        # Still running, or finished with results not yet drained
+        return self.busy or not self.results.empty()
+
+    def start(self, *args):
+        if self.busy:
+            return False
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=args, daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self):
+        self._stop.set()
+
+    def drain(self, callback):
+        while True:
+            try:
+                result = self.results.get_nowait()
+            except queue.Empty:
+                return
+            callback(*result)
+
+    def _run(self, *args):
+        raise NotImplementedError